@@ -8,7 +8,7 @@ or call:  compute_all_embeddings(progress_callback=...)
 
 import numpy as np
 
-from config import EMBEDDING_MODEL, EMBEDDING_BATCH_SIZE
+from config import EMBEDDING_MODEL, EMBEDDING_BATCH_SIZE, EMBEDDING_INPUT_SIZE
 from db.database import get_cards_without_embeddings, upsert_embeddings_batch
 
 
@@ -79,25 +79,20 @@ def compute_embedding_for_image(image_path: str) -> np.ndarray:
     return vec.astype(np.float32)
 
 
-def _load_image_batch(rows: list) -> tuple[list, list]:
+def _load_image_batch(rows: list, out: "np.ndarray | None" = None) -> tuple[list, np.ndarray]:
     """
-    Preprocess a batch of card images into numpy arrays.
+    Preprocess a batch of card images into one (N, 3, 518, 518) array.
     Skips unreadable images silently.
-    Returns (valid_rows, arrays) — parallel lists of rows and (3,518,518) arrays.
+    Returns (valid_rows, batch) — batch[i] is the array for valid_rows[i].
+    *out* is an optional buffer reused across batches.
     """
-    from identifier.preprocess import preprocess_for_embedding
-
-    valid_rows = []
-    arrays = []
-    for row in rows:
-        try:
-            arr = preprocess_for_embedding(row["local_image_path"])
-            valid_rows.append(row)
-            arrays.append(arr)
-        except Exception:
-            pass  # error counted in caller via len(chunk) - len(valid_rows)
+    from identifier.preprocess import preprocess_for_embedding_batch
 
-    return valid_rows, arrays
+    batch, ok = preprocess_for_embedding_batch(
+        [row["local_image_path"] for row in rows], out=out,
+    )
+    # errors are counted in caller via len(chunk) - len(valid_rows)
+    return [rows[i] for i in ok], batch
 
 
 def compute_all_embeddings(progress_callback=None) -> int:
@@ -126,20 +121,23 @@ def compute_all_embeddings(progress_callback=None) -> int:
     done = 0
     errors = 0
     db_batch: list[dict] = []
+    # Reused across batches — each image is preprocessed straight into its slot
+    batch_buf = np.empty(
+        (EMBEDDING_BATCH_SIZE, 3, EMBEDDING_INPUT_SIZE, EMBEDDING_INPUT_SIZE),
+        dtype=np.float32,
+    )
 
     for batch_start in range(0, len(pending), EMBEDDING_BATCH_SIZE):
         chunk = pending[batch_start: batch_start + EMBEDDING_BATCH_SIZE]
 
-        valid_rows, arrays = _load_image_batch(chunk)
+        valid_rows, batch = _load_image_batch(chunk, out=batch_buf)
         errors += len(chunk) - len(valid_rows)
 
-        if not arrays:
+        if not valid_rows:
             continue
 
-        # Stack into (N, 3, 518, 518) and run a single GPU forward pass
-        batch_tensor = torch.from_numpy(
-            np.stack(arrays, axis=0)          # already float32 from preprocess
-        ).to(device)
+        # (N, 3, 518, 518), already float32 — one GPU forward pass
+        batch_tensor = torch.from_numpy(batch).to(device)
 
         with torch.no_grad():
             embeddings = model(batch_tensor)  # (N, 768)
@@ -7,6 +7,7 @@ or call:  compute_all_hashes(progress_callback=...)
 
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 from PIL import Image
 import imagehash
 
@@ -26,8 +27,63 @@ _HASH_FN = {
 }
 
 
-def compute_hashes_for_image(image_path: str) -> dict[str, str]:
-    """Load an image and return a dict of {hash_type: hash_string}.
+# Bit-matrix versions of the imagehash algorithms, used by compute_packed_hashes.
+# Each mirrors the corresponding imagehash function step for step (same
+# LANCZOS resize, same threshold) but takes an already-greyscale image and
+# returns the bool matrix directly, without wrapping it in an ImageHash.
+def _ahash_bits(gray: Image.Image, hash_size: int) -> np.ndarray:
+    pixels = np.asarray(gray.resize((hash_size, hash_size), Image.LANCZOS))
+    return pixels > pixels.mean()
+
+
+def _dhash_bits(gray: Image.Image, hash_size: int) -> np.ndarray:
+    pixels = np.asarray(gray.resize((hash_size + 1, hash_size), Image.LANCZOS))
+    return pixels[:, 1:] > pixels[:, :-1]
+
+
+def _phash_bits(gray: Image.Image, hash_size: int) -> np.ndarray:
+    import scipy.fftpack     # imagehash dependency; same lazy import it uses
+    img_size = hash_size * 4
+    pixels = np.asarray(gray.resize((img_size, img_size), Image.LANCZOS))
+    dct = scipy.fftpack.dct(scipy.fftpack.dct(pixels, axis=0), axis=1)
+    lowfreq = dct[:hash_size, :hash_size]
+    return lowfreq > np.median(lowfreq)
+
+
+def _whash_bits(gray: Image.Image, hash_size: int) -> np.ndarray:
+    # Wavelet hash has enough moving parts that it stays on imagehash
+    return imagehash.whash(gray, hash_size=hash_size).hash
+
+
+_BITS_FN = {
+    "phash": _phash_bits,
+    "ahash": _ahash_bits,
+    "dhash": _dhash_bits,
+    "whash": _whash_bits,
+}
+
+
+def compute_packed_hashes(img: Image.Image) -> dict[str, np.ndarray]:
+    """Return {hash_type: packed uint8 bytes} for an already-prepared image.
+
+    The bytes are identical to bytes.fromhex(str(_HASH_FN[ht](img, ...))) —
+    the layout stored in card_hashes.hash_value — but the image is converted
+    to greyscale once for all hash types, and no ImageHash objects or hex
+    strings are created.  Used both for card images and for scans.
+
+    Every hash starts from greyscale, so callers hashing several crops of
+    one image should convert it to mode "L" once and pass the crops of that;
+    an "L" image is used as-is.
+    """
+    gray = img if img.mode == "L" else img.convert("L")
+    return {
+        ht: np.packbits(_BITS_FN[ht](gray, PHASH_SIZE))
+        for ht in HASH_TYPES
+    }
+
+
+def compute_hashes_for_image(image_path: str) -> dict[str, bytes]:
+    """Load an image and return a dict of {hash_type: packed hash bytes}.
 
     Computes two sets of hashes per card:
     - Standard (phash / ahash / dhash / whash): full 300×420 card image.
@@ -40,22 +96,24 @@ def compute_hashes_for_image(image_path: str) -> dict[str, str]:
     new hash entries in the DB.
     """
     W, H = HASH_IMAGE_SIZE
-    img = Image.open(image_path).convert("RGB").resize(HASH_IMAGE_SIZE)
+    # Greyscale once — every hash type works on luminance only, and cropping
+    # the greyscale image gives the same pixels as greyscaling the crop.
+    img = Image.open(image_path).convert("RGB").resize(HASH_IMAGE_SIZE).convert("L")
 
     # Standard hashes — full 300×420 card
-    result = {ht: str(_HASH_FN[ht](img, hash_size=PHASH_SIZE)) for ht in HASH_TYPES}
+    result = {ht: raw.tobytes() for ht, raw in compute_packed_hashes(img).items()}
 
     # Art-zone hashes — illustration box only (avoids top and bottom sticker zones)
     art_y0 = int(H * HASH_ART_Y0)   # ≈ 55 px
     art_y1 = int(H * HASH_ART_Y1)   # ≈ 221 px
     art_img = img.crop((0, art_y0, W, art_y1))   # 300 × ~166 px
-    for ht in HASH_TYPES:
-        result[f"{ht}_art"] = str(_HASH_FN[ht](art_img, hash_size=PHASH_SIZE))
+    for ht, raw in compute_packed_hashes(art_img).items():
+        result[f"{ht}_art"] = raw.tobytes()
 
     return result
 
 
-def _hash_row(row) -> tuple[str, dict[str, str] | None]:
+def _hash_row(row) -> tuple[str, dict[str, bytes] | None]:
     """Worker function: hash one card image. Returns (card_id, hashes | None)."""
     try:
         hashes = compute_hashes_for_image(row["local_image_path"])
@@ -1,4 +1,7 @@
+import json
 import sqlite3
+import time
+from functools import lru_cache
 from pathlib import Path
 import config as _config
 from config import BASE_DIR
@@ -23,7 +26,8 @@ def migrate_db():
     """
     Apply incremental schema migrations that cannot be expressed in schema.sql
     (CREATE TABLE IF NOT EXISTS never adds new columns to existing tables).
-    Safe to call repeatedly — each ALTER is wrapped in try/except.
+    Safe to call repeatedly — each ALTER is wrapped in try/except, and
+    one-time data conversions are gated on PRAGMA user_version.
     """
     new_columns = [
         ("variants",          "TEXT"),   # JSON: {normal,reverse,holo,firstEdition,wPromo}
@@ -37,6 +41,29 @@ def migrate_db():
             except sqlite3.OperationalError:
                 pass  # column already exists — normal on subsequent startups
 
+        # card_hashes.hash_value used to hold hex text; it now holds the raw
+        # packed bytes (half the size, no decode at index load).  SQLite keeps
+        # a bytes value as a BLOB even in the old TEXT-declared column, so the
+        # rows are converted in place.  Undecodable rows are left untouched.
+        # Finding them is a full table scan (typeof() can't use an index), so
+        # it runs once: user_version 1 marks the conversion as done.
+        if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+            hex_rows = conn.execute(
+                "SELECT rowid, hash_value FROM card_hashes WHERE typeof(hash_value) = 'text'"
+            ).fetchall()
+            converted = []
+            for rowid, value in hex_rows:
+                try:
+                    converted.append((bytes.fromhex(value), rowid))
+                except ValueError:
+                    pass
+            if converted:
+                conn.executemany(
+                    "UPDATE card_hashes SET hash_value = ? WHERE rowid = ?", converted
+                )
+                _bump_card_hashes_version(conn)
+            conn.execute("PRAGMA user_version = 1")
+
 
 def card_count() -> int:
     with get_connection() as conn:
@@ -60,6 +87,7 @@ def upsert_card(card: dict):
     """
     with get_connection() as conn:
         conn.execute(sql, card)
+    _invalidate_card_cache()
 
 
 def upsert_cards_batch(cards: list[dict]):
@@ -81,15 +109,18 @@ def upsert_cards_batch(cards: list[dict]):
     """
     with get_connection() as conn:
         conn.executemany(sql, cards)
+    _invalidate_card_cache()
 
 
 def upsert_hashes_batch(hashes: list[dict]):
+    """Insert or replace hash rows; hash_value is the packed hash as bytes."""
     sql = """
         INSERT OR REPLACE INTO card_hashes (card_id, hash_type, hash_value)
         VALUES (:card_id, :hash_type, :hash_value)
     """
     with get_connection() as conn:
         conn.executemany(sql, hashes)
+        _bump_card_hashes_version(conn)
 
 
 def get_cards_without_images() -> list[sqlite3.Row]:
@@ -123,6 +154,7 @@ def get_cards_without_images() -> list[sqlite3.Row]:
                 missing_ids,
             ).fetchall()
             rows = list(rows) + list(extra)
+            _invalidate_card_cache()
 
         return rows
 
@@ -141,12 +173,14 @@ def update_image_url(card_id: str, url: str):
             "UPDATE cards SET image_url = ? WHERE id = ?",
             (url, card_id)
         )
+    _invalidate_card_cache()
 
 
 def clear_all_hashes():
     """Delete all rows from card_hashes (used when hash parameters change and a full rehash is needed)."""
     with get_connection() as conn:
         conn.execute("DELETE FROM card_hashes")
+        _bump_card_hashes_version(conn)
 
 
 def get_cards_without_hashes() -> list[sqlite3.Row]:
@@ -182,9 +216,77 @@ def get_all_hashes(hash_type: str) -> list[sqlite3.Row]:
         ).fetchall()
 
 
-def get_card_by_id(card_id: str) -> sqlite3.Row | None:
+def _bump_card_hashes_version(conn: sqlite3.Connection) -> None:
+    """Count one change to card_hashes, inside the caller's write transaction.
+
+    Every function that writes card_hashes calls this once per batch (see
+    card_hashes_state).
+    """
+    conn.execute(
+        "UPDATE table_versions SET version = version + 1 WHERE name = 'card_hashes'"
+    )
+
+
+def card_hashes_state() -> list[int]:
+    """Return [version, row count, max rowid] of card_hashes.
+
+    version is bumped by every write to the table (_bump_card_hashes_version);
+    the count and max rowid also tell apart a database swapped out
+    wholesale.  Used as the freshness key of the on-disk hash index cache.
+    """
+    with get_connection() as conn:
+        row = conn.execute(
+            """SELECT (SELECT version FROM table_versions WHERE name = 'card_hashes'),
+                      (SELECT COUNT(*) FROM card_hashes),
+                      (SELECT COALESCE(MAX(rowid), 0) FROM card_hashes)"""
+        ).fetchone()
+    if row[0] is None:
+        raise sqlite3.OperationalError("card_hashes version row missing")
+    return list(row)
+
+
+@lru_cache(maxsize=4096)
+def _get_card_by_id_cached(db_path: str, card_id: str) -> dict | None:
+    """Cached row lookup keyed by (db_path, card_id) — see get_card_by_id."""
     with get_connection() as conn:
-        return conn.execute("SELECT * FROM cards WHERE id = ?", (card_id,)).fetchone()
+        row = conn.execute("SELECT * FROM cards WHERE id = ?", (card_id,)).fetchone()
+    return dict(row) if row is not None else None
+
+
+def _invalidate_card_cache() -> None:
+    """Drop cached card rows.  Called by every function that writes to cards."""
+    _get_card_by_id_cached.cache_clear()
+
+
+def get_card_by_id(card_id: str) -> dict | None:
+    """Return the cards row for *card_id* as a plain dict, or None.
+
+    Rows are memoised (the matcher and enricher both look up the same top-K
+    card ids on every identify) and the cache is cleared whenever the cards
+    table is written.  A copy is returned so callers can't mutate the cache.
+    """
+    row = _get_card_by_id_cached(str(_config.DB_PATH), card_id)
+    return dict(row) if row is not None else None
+
+
+def get_cards_by_ids(card_ids: list[str]) -> dict[str, dict]:
+    """Return {card_id: cards row as a dict} for every id that exists.
+
+    One ``WHERE id IN (...)`` query instead of a round-trip per id — used for
+    the top-K results of an identify.  Ids are queried in chunks to stay
+    under SQLite's bound-parameter limit.
+    """
+    rows: dict[str, dict] = {}
+    ids = list(dict.fromkeys(card_ids))
+    with get_connection() as conn:
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"SELECT * FROM cards WHERE id IN ({placeholders})", chunk
+            ):
+                rows[row["id"]] = dict(row)
+    return rows
 
 
 def update_local_image_path(card_id: str, path: str):
@@ -193,6 +295,7 @@ def update_local_image_path(card_id: str, path: str):
             "UPDATE cards SET local_image_path = ? WHERE id = ?",
             (path, card_id)
         )
+    _invalidate_card_cache()
 
 
 def relink_images_from_folder(folder: Path) -> tuple[int, int]:
@@ -224,6 +327,7 @@ def relink_images_from_folder(folder: Path) -> tuple[int, int]:
                 "UPDATE cards SET local_image_path = ? WHERE id = ?",
                 updates,
             )
+    _invalidate_card_cache()
 
     return len(updates), len(files)
 
@@ -299,6 +403,7 @@ def update_card_details(card_id: str, variants_json: str | None, set_total: str
             "WHERE id = ?",
             (variants_json, set_total, types_json, variants_detailed_json, card_id),
         )
+    _invalidate_card_cache()
 
 
 def update_card_full_metadata(card_id: str, set_name: str | None, rarity: str | None,
@@ -319,6 +424,7 @@ def update_card_full_metadata(card_id: str, set_name: str | None, rarity: str |
                WHERE id = ?""",
             (set_name, rarity, category, hp, variants_json, set_total, types_json, card_id),
         )
+    _invalidate_card_cache()
 
 
 def get_cards_without_set_name() -> list[sqlite3.Row]:
@@ -327,3 +433,65 @@ def get_cards_without_set_name() -> list[sqlite3.Row]:
         return conn.execute(
             "SELECT id FROM cards WHERE set_name IS NULL"
         ).fetchall()
+
+
+def _price_db_path() -> Path:
+    """prices.db, next to cards.db (read at call time, like DB_PATH)."""
+    return Path(_config.DB_PATH).parent / "prices.db"
+
+
+_price_db_ready: set[str] = set()   # price DB paths whose schema has been applied
+
+
+def get_price_connection() -> sqlite3.Connection:
+    """Connection to the live-price cache database (prices/fetcher.py).
+
+    A separate file from cards.db: the GUI prices a card after every
+    identify, and those writes must not touch the card database.  The
+    schema is applied on first use of each path.
+    """
+    path = _price_db_path()
+    conn = sqlite3.connect(path)
+    if str(path) not in _price_db_ready:
+        conn.executescript((BASE_DIR / "db" / "prices_schema.sql").read_text())
+        _price_db_ready.add(str(path))
+    return conn
+
+
+def get_cached_pricing(card_id: str, max_age: int) -> dict | None:
+    """Return the cached TCGdex pricing block for *card_id* if it is younger
+    than *max_age* seconds, else None."""
+    with get_price_connection() as conn:
+        row = conn.execute(
+            "SELECT pricing FROM price_cache WHERE card_id = ? AND fetched_at >= ?",
+            (card_id, int(time.time()) - max_age),
+        ).fetchone()
+    return json.loads(row[0]) if row is not None else None
+
+
+def save_cached_pricing(card_id: str, pricing: dict) -> None:
+    """Store (or refresh) the TCGdex pricing block for *card_id*."""
+    with get_price_connection() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO price_cache (card_id, pricing, fetched_at) VALUES (?, ?, ?)",
+            (card_id, json.dumps(pricing), int(time.time())),
+        )
+
+
+def get_cached_rate(currency: str, max_age: int) -> float | None:
+    """Return the cached *currency*→CAD rate if younger than *max_age* seconds."""
+    with get_price_connection() as conn:
+        row = conn.execute(
+            "SELECT rate FROM forex_cache WHERE currency = ? AND fetched_at >= ?",
+            (currency, int(time.time()) - max_age),
+        ).fetchone()
+    return row[0] if row is not None else None
+
+
+def save_cached_rate(currency: str, rate: float) -> None:
+    """Store (or refresh) the *currency*→CAD rate."""
+    with get_price_connection() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO forex_cache (currency, rate, fetched_at) VALUES (?, ?, ?)",
+            (currency, rate, int(time.time())),
+        )
@@ -0,0 +1,15 @@
+-- Live-price caches for prices/fetcher.py (fetched_at = unix seconds).
+-- Kept in prices.db next to cards.db rather than in it, so pricing lookups
+-- never write to the card database (whose contents the hash index cache
+-- is keyed on).
+CREATE TABLE IF NOT EXISTS price_cache (
+    card_id    TEXT PRIMARY KEY,
+    pricing    TEXT NOT NULL,     -- JSON "pricing" block from the TCGdex card endpoint
+    fetched_at INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS forex_cache (
+    currency   TEXT PRIMARY KEY,  -- e.g. "USD"; rate converts it to CAD
+    rate       REAL NOT NULL,
+    fetched_at INTEGER NOT NULL
+);
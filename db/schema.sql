@@ -16,7 +16,7 @@ CREATE TABLE IF NOT EXISTS cards (
 CREATE TABLE IF NOT EXISTS card_hashes (
     card_id TEXT NOT NULL REFERENCES cards(id) ON DELETE CASCADE,
     hash_type TEXT NOT NULL,
-    hash_value TEXT NOT NULL,
+    hash_value BLOB NOT NULL,  -- packed hash bits, PHASH_SIZE²/8 bytes
     PRIMARY KEY (card_id, hash_type)
 );
 
@@ -26,3 +26,18 @@ CREATE TABLE IF NOT EXISTS card_embeddings (
     card_id   TEXT PRIMARY KEY REFERENCES cards(id) ON DELETE CASCADE,
     embedding BLOB NOT NULL  -- float32 numpy tobytes(), shape (1280,) = 5120 bytes/row
 );
+
+-- Change counter for card_hashes, bumped once per write transaction by the
+-- functions in db/database.py that modify it.  The on-disk hash index cache
+-- (identifier/matcher.py) is keyed on it, so unrelated writes to this
+-- database don't invalidate that cache.
+CREATE TABLE IF NOT EXISTS table_versions (
+    name    TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO table_versions (name, version) VALUES ('card_hashes', 0);
+
+-- Per-row triggers that used to bump it (one extra UPDATE per hash row)
+DROP TRIGGER IF EXISTS card_hashes_version_ins;
+DROP TRIGGER IF EXISTS card_hashes_version_upd;
+DROP TRIGGER IF EXISTS card_hashes_version_del;
@@ -0,0 +1,89 @@
+"""
+Numba kernel for weighted Hamming distance over the fused hash index.
+
+Computes, for every row i of the packed uint64 index (T segments of W words,
+one segment per hash type),
+
+    out[i] = scale * sum_t seg_weight[t] * sum_w popcount(index[i, t*W + w] ^ scan[t*W + w])
+
+in one parallel loop — no XOR / popcount / float32 temporaries.  The popcount
+is emitted directly as LLVM's ctpop intrinsic rather than left for the
+optimiser to pattern-match, and numba compiles for the host CPU, so the
+hardware instruction is picked at JIT time: vpopcntq on CPUs with AVX-512
+VPOPCNTDQ, the vpshufb nibble-LUT sequence on AVX2, scalar POPCNT otherwise.
+The weights are small integers, so the whole row is reduced in integer
+arithmetic (popcounts summed per segment, multiplied by the segment weight)
+and converted to float exactly once, when ``scale`` (1 / weight sum) is
+applied.  The inner loop is pure integer work that LLVM can vectorise.
+
+Optional: numba is not a hard dependency.  identifier.matcher imports this
+module lazily and falls back to the NumPy path if the import fails.  The
+kernel is compiled eagerly (explicit signature) on first import and cached
+to __pycache__, so only the very first run pays the JIT cost.
+"""
+
+import numpy as np
+from numba import njit, prange, types
+from numba.extending import intrinsic
+
+
+@intrinsic
+def _popcount64(typingctx, x):
+    """Hardware popcount of a uint64 (llvm.ctpop.i64)."""
+    sig = types.uint64(types.uint64)
+
+    def codegen(context, builder, signature, args):
+        return builder.ctpop(args[0])
+
+    return sig, codegen
+
+
+@njit(
+    "void(uint64[:, ::1], uint64[::1], int32[::1], float32, float32[::1])",
+    parallel=True, fastmath=True, cache=True,
+)
+def weighted_hamming(index, scan, seg_weight, scale, out):
+    """Fill out[i] with the weighted Hamming distance of index row i to scan."""
+    n, cols = index.shape
+    n_seg = seg_weight.shape[0]
+    words = cols // n_seg
+    for i in prange(n):
+        acc = np.int64(0)
+        for t in range(n_seg):
+            base = t * words
+            bits = np.uint64(0)
+            for w in range(words):
+                bits += _popcount64(index[i, base + w] ^ scan[base + w])
+            acc += np.int64(bits) * seg_weight[t]
+        out[i] = np.float32(acc) * scale
+
+
+@njit("int64[::1](float32[::1], int64)", cache=True)
+def smallest_k(dist, k):
+    """
+    Indices of the k smallest entries of dist, sorted ascending.
+
+    One pass keeping a sorted buffer of the k best so far — for k ≪ N almost
+    every element is rejected by a single compare against the current worst,
+    so nothing N-sized is allocated or reordered.  Ties keep the lower index.
+    """
+    k = min(k, dist.shape[0])
+    idx = np.empty(k, dtype=np.int64)
+    val = np.empty(k, dtype=np.float32)
+    filled = 0
+    for i in range(dist.shape[0]):
+        d = dist[i]
+        if filled == k:
+            if not d < val[k - 1]:
+                continue
+            j = k - 1
+        else:
+            j = filled
+            filled += 1
+        while j > 0 and d < val[j - 1]:
+            val[j] = val[j - 1]
+            idx[j] = idx[j - 1]
+            j -= 1
+        val[j] = d
+        idx[j] = i
+    return idx
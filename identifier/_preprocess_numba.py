@@ -0,0 +1,99 @@
+"""
+Numba kernels for identifier.preprocess.
+
+normalize_bgr_to_chw — the final step of preprocess_for_embedding.
+
+Turns the (S, S, 3) uint8 BGR card crop straight into the (3, S, S) float32
+RGB, ImageNet-normalised CHW tensor in one parallel pass:
+
+    out[c, y, x] = bgr[y, x, 2 - c] * scale[c] - bias[c]
+
+with scale = 1 / (255 * std) and bias = mean / std precomputed, so each
+output element is a single multiply-add.  The NumPy version needs a colour
+conversion, a float cast, a divide, a subtract, a divide and a transposing
+copy — six full passes over a ~3 MB tensor for S = 518.
+
+card_shape_ok — _is_card_shaped in one compiled call.  Card detection tests
+every 4-point approximation of every candidate contour; in Python each test
+is a dozen small NumPy / math calls (corner ordering, four side lengths,
+area), so the per-call overhead is most of its cost.
+
+Optional: numba is not a hard dependency.  identifier.preprocess imports this
+module lazily and falls back to NumPy / Python if the import fails.  The
+kernels are compiled eagerly (explicit signature) on first import and cached to
+__pycache__, so only the very first run pays the JIT cost.
+"""
+
+import os
+
+import numpy as np
+from numba import config, njit, prange
+
+# This module is imported lazily, usually on a preprocess_many worker thread.
+# Numba's default pick for the parallel kernel, TBB, hangs the interpreter at
+# exit when it is first started off the main thread, so prefer OpenMP.
+if "NUMBA_THREADING_LAYER_PRIORITY" not in os.environ:
+    config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+
+
+@njit(
+    "void(uint8[:, :, ::1], float32[::1], float32[::1], float32[:, :, ::1])",
+    parallel=True, fastmath=True, cache=True,
+)
+def normalize_bgr_to_chw(bgr, scale, bias, out):
+    """Fill out (3, H, W) with the normalised RGB planes of bgr (H, W, 3)."""
+    h, w = bgr.shape[0], bgr.shape[1]
+    for y in prange(h):
+        for c in range(3):
+            s = scale[c]
+            b = bias[c]
+            src = 2 - c
+            for x in range(w):
+                out[c, y, x] = bgr[y, x, src] * s - b
+
+
+@njit("boolean(float32[:, ::1], float64, float64)", cache=True)
+def card_shape_ok(pts, img_area, card_asp):
+    """
+    Numba twin of preprocess._is_card_shaped for one 4×2 quad: order the
+    corners, then the minimum-size, aspect-ratio (±30%, either orientation)
+    and ≥5%-of-image area tests.
+    """
+    # Order corners: tl = min(x+y), br = max(x+y), tr = min(y-x), bl = max(y-x)
+    # (first index wins ties, like np.argmin / np.argmax)
+    i_tl = i_br = i_tr = i_bl = 0
+    for i in range(1, 4):
+        s = pts[i, 0] + pts[i, 1]
+        d = pts[i, 1] - pts[i, 0]
+        if s < pts[i_tl, 0] + pts[i_tl, 1]:
+            i_tl = i
+        if s > pts[i_br, 0] + pts[i_br, 1]:
+            i_br = i
+        if d < pts[i_tr, 1] - pts[i_tr, 0]:
+            i_tr = i
+        if d > pts[i_bl, 1] - pts[i_bl, 0]:
+            i_bl = i
+    tlx, tly = np.float64(pts[i_tl, 0]), np.float64(pts[i_tl, 1])
+    trx, try_ = np.float64(pts[i_tr, 0]), np.float64(pts[i_tr, 1])
+    brx, bry = np.float64(pts[i_br, 0]), np.float64(pts[i_br, 1])
+    blx, bly = np.float64(pts[i_bl, 0]), np.float64(pts[i_bl, 1])
+
+    w = max(np.hypot(trx - tlx, try_ - tly), np.hypot(brx - blx, bry - bly))
+    h = max(np.hypot(tlx - blx, tly - bly), np.hypot(trx - brx, try_ - bry))
+    if w < 20.0 or h < 20.0:
+        return False
+
+    aspect = h / w
+    inv_asp = 1.0 / card_asp
+    if not (abs(aspect - card_asp) / card_asp < 0.30
+            or abs(aspect - inv_asp) / inv_asp < 0.30):
+        return False
+
+    # Shoelace area of the ordered quad (what cv2.contourArea computes)
+    area = 0.5 * abs(
+        tlx * try_ - trx * tly
+        + trx * bry - brx * try_
+        + brx * bly - blx * bry
+        + blx * tly - tlx * bly
+    )
+    return area / img_area >= 0.05
@@ -14,6 +14,11 @@ Test-Time Augmentation (TTA):
   embedded in a single GPU batch, then averaged and re-normalised before
   the FAISS search.  This reduces sensitivity to exact crop alignment,
   compression artefacts, and lighting variation.
+
+GPU search:
+  When FAISS reports a GPU (faiss-gpu build), the index is mirrored onto
+  device 0 at load time and the TTA query stays a CUDA tensor all the way
+  into the search — no device→host copy of the query.
 """
 
 import random
@@ -21,7 +26,7 @@ import random
 import numpy as np
 
 from config import TOP_K_MATCHES, EMBEDDING_CONFIDENCE_HIGH, EMBEDDING_CONFIDENCE_MED
-from db.database import get_all_embeddings, get_card_by_id
+from db.database import get_all_embeddings, get_cards_by_ids
 from identifier.enricher import enrich_result
 
 # Embedding dimension produced by DINOv2 vit_base_patch14 global-average-pool head
@@ -30,6 +35,7 @@ _EMBEDDING_DIM = 768
 # ── Module-level FAISS index cache ───────────────────────────────────────────
 _faiss_index = None           # faiss.IndexFlatIP, built at load time
 _index_card_ids: list[str] = []  # parallel list: FAISS row i → card_id
+_faiss_gpu_res = None         # faiss.StandardGpuResources, kept alive with the GPU index
 
 
 def _load_embedding_index():
@@ -37,6 +43,7 @@ def _load_embedding_index():
     Read all embeddings from the DB and build a FAISS IndexFlatIP.
     Returns (index, card_ids) — or (None, []) if no embeddings are stored.
     """
+    global _faiss_gpu_res
     import faiss
 
     rows = get_all_embeddings()
@@ -67,6 +74,16 @@ def _load_embedding_index():
     index = faiss.IndexFlatIP(_EMBEDDING_DIM)
     index.add(matrix)
 
+    # Mirror onto the GPU when faiss-gpu is installed and a device is visible.
+    # faiss-cpu builds lack get_num_gpus / StandardGpuResources entirely.
+    if getattr(faiss, "get_num_gpus", lambda: 0)() > 0:
+        try:
+            if _faiss_gpu_res is None:
+                _faiss_gpu_res = faiss.StandardGpuResources()
+            index = faiss.index_cpu_to_gpu(_faiss_gpu_res, 0, index)
+        except Exception:
+            pass   # keep the CPU index
+
     return index, card_ids
 
 
@@ -100,10 +117,25 @@ from identifier.preprocess import _IMAGENET_MEAN, _IMAGENET_STD  # noqa: E402
 # Lazy import of the model singleton from embedding_computer.
 from cards.embedding_computer import _get_model as _get_model_for_tta  # noqa: E402
 
+# (1, 3, 1, 1) float32 mean/std tensors on the model device — built once on
+# first TTA call so the per-crop normalisation runs on the stacked batch.
+_norm_tensors: dict = {}   # device → (mean, std)
+
+
+def _get_norm_tensors(device):
+    """Return the cached ImageNet (mean, std) tensors on *device*."""
+    if device not in _norm_tensors:
+        import torch
+        _norm_tensors[device] = (
+            torch.from_numpy(_IMAGENET_MEAN).view(1, 3, 1, 1).to(device),
+            torch.from_numpy(_IMAGENET_STD).view(1, 3, 1, 1).to(device),
+        )
+    return _norm_tensors[device]
+
 
 def _embed_with_tta(image_path: str, num_crops: int = 4,
                     sticker_mask_px: "tuple | None" = None,
-                    auto_detect: "bool | None" = None) -> np.ndarray:
+                    auto_detect: "bool | None" = None) -> "torch.Tensor":
     """
     Compute a TTA-averaged embedding for a single query image.
 
@@ -118,7 +150,9 @@ def _embed_with_tta(image_path: str, num_crops: int = 4,
     given it is scaled to each crop's size; otherwise auto-detection runs
     on the first crop and the same mask is reused for subsequent crops.
 
-    Returns shape (768,) float32, L2-normalised.
+    Returns a (768,) float32 L2-normalised torch tensor on the model's
+    device — the averaging and normalisation run there too, so on CUDA the
+    vector never round-trips through host memory.
     """
     import cv2
     import torch
@@ -179,24 +213,30 @@ def _embed_with_tta(image_path: str, num_crops: int = 4,
         if _sticker_mask_518 is not None:
             resized = inpaint_sticker(resized, _sticker_mask_518, STICKER_INPAINT_RADIUS)
 
-        rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
-
-        arr = rgb.astype(np.float32) / 255.0
-        arr = (arr - _IMAGENET_MEAN) / _IMAGENET_STD
-        arr = arr.transpose(2, 0, 1)   # CHW
-        arrays.append(arr)
+        # Keep crops as uint8 HWC — normalisation happens once on the batch
+        arrays.append(cv2.cvtColor(resized, cv2.COLOR_BGR2RGB))
+
+    # Upload uint8 (4× fewer bytes than float32), then scale, ImageNet-normalise
+    # and go HWC→CHW on the device in one chain of in-place ops.
+    mean_t, std_t = _get_norm_tensors(device)
+    batch = (
+        torch.from_numpy(np.stack(arrays))               # (num_crops, S, S, 3) uint8
+        .to(device, non_blocking=True)
+        .permute(0, 3, 1, 2)                             # (num_crops, 3, S, S)
+        .float()
+        .div_(255.0)
+        .sub_(mean_t)
+        .div_(std_t)
+    )
 
     # Single GPU forward pass for all crops — no extra latency vs single crop
-    batch = torch.from_numpy(np.stack(arrays)).to(device)   # (num_crops, 3, S, S)
     with torch.no_grad():
         embs = model(batch)   # (num_crops, 768)
 
-    vecs = embs.cpu().numpy()   # (num_crops, 768)
-
-    # Average then re-normalise to get the TTA embedding
-    avg = vecs.mean(axis=0)     # (768,)
-    norm = np.linalg.norm(avg)
-    return (avg / norm if norm > 0 else avg).astype(np.float32)
+        # Average then re-normalise to get the TTA embedding
+        avg = embs.float().mean(dim=0)   # (768,)
+        norm = avg.norm()
+        return avg / norm if norm > 0 else avg
 
 
 # ── Public API ────────────────────────────────────────────────────────────────
@@ -226,24 +266,32 @@ def identify_card_embedding(image_path: str,
     # Compute TTA query embedding (768-dim, L2-normalised)
     query_vec = _embed_with_tta(image_path,
                                 sticker_mask_px=sticker_mask_px,
-                                auto_detect=auto_detect)  # (768,) float32
-    query_matrix = query_vec.reshape(1, -1)        # (1, 768) for FAISS
+                                auto_detect=auto_detect)  # (768,) float32 tensor
+    query_matrix = query_vec.unsqueeze(0)          # (1, 768) for FAISS
 
     # index.search returns (similarities, indices) each of shape (1, k)
     k = min(TOP_K_MATCHES, index.ntotal)
-    similarities, indices = index.search(query_matrix, k)
+    if query_matrix.is_cuda and hasattr(index, "getDevice"):
+        # GPU index + CUDA query: torch_utils lets FAISS read the tensor in place
+        import faiss.contrib.torch_utils  # noqa: F401
+        similarities, indices = index.search(query_matrix, k)
+        similarities, indices = similarities.cpu().numpy(), indices.cpu().numpy()
+    else:
+        similarities, indices = index.search(query_matrix.cpu().numpy(), k)
 
     sims = similarities[0]    # (k,) — cosine similarities, descending
     idxs = indices[0]         # (k,) — row indices into _index_card_ids
 
+    # One query for all top-K card rows (FAISS pads with -1 when ntotal < k)
+    rows = get_cards_by_ids([card_ids[int(i)] for i in idxs if 0 <= i < len(card_ids)])
+
     results = []
     for sim, idx in zip(sims, idxs):
-        # FAISS pads with -1 when ntotal < k
         if idx < 0 or idx >= len(card_ids):
             continue
 
         card_id = card_ids[int(idx)]
-        row = get_card_by_id(card_id)
+        row = rows.get(card_id)
         if row is None:
             continue
 
@@ -21,6 +21,7 @@ enrich_result(result_dict)  →  result_dict (modified in-place, also returned)
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import requests as _requests
 
@@ -31,6 +32,28 @@ from db.database import get_card_by_id, update_card_details
 # if the API call fails (avoids hammering the endpoint on every identify).
 _failed_ids: set[str] = set()
 
+# Shared pool for the SDK + REST lookups in _fetch_full_card.  Bounded so a
+# burst of cache misses (e.g. a batch scan) can't flood the TCGdex API.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="enricher")
+
+
+def _fetch_variants_detailed(card_id: str) -> str | None:
+    """Fetch variants_detailed from the TCGdex REST API (SDK does not expose it).
+
+    Returns the JSON-encoded list, or None if missing or on any error.
+    """
+    try:
+        r = _requests.get(
+            f"https://api.tcgdex.net/v2/en/cards/{card_id}", timeout=8
+        )
+        if r.status_code == 200:
+            vd = r.json().get("variants_detailed")
+            if vd:
+                return json.dumps(vd)
+    except Exception:
+        pass
+    return None
+
 
 def _fetch_full_card(card_id: str) -> dict | None:
     """
@@ -41,7 +64,12 @@ def _fetch_full_card(card_id: str) -> dict | None:
     try:
         from tcgdexsdk import TCGdex
         sdk = TCGdex(TCGDEX_LANGUAGE)
+
+        # The SDK fetch and the REST fetch are independent — run them
+        # concurrently so a cache miss costs one round-trip, not two.
+        rest_future = _FETCH_POOL.submit(_fetch_variants_detailed, card_id)
         card = sdk.card.getSync(card_id)
+        variants_detailed_json = rest_future.result()
         if card is None:
             return None
 
@@ -76,19 +104,6 @@ def _fetch_full_card(card_id: str) -> dict | None:
         types = getattr(card, "types", None)
         types_json = json.dumps(types) if types else None
 
-        # ── variants_detailed (REST-only — SDK does not expose it) ────────────
-        variants_detailed_json = None
-        try:
-            r = _requests.get(
-                f"https://api.tcgdex.net/v2/en/cards/{card_id}", timeout=8
-            )
-            if r.status_code == 200:
-                vd = r.json().get("variants_detailed")
-                if vd:
-                    variants_detailed_json = json.dumps(vd)
-        except Exception:
-            pass
-
         return {
             "variants_json":          variants_json,
             "set_total":              set_total,
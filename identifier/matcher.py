@@ -6,12 +6,31 @@ matching card(s) in the local hash database.
 
 Performance design
 ------------------
-The index stores hashes as packed uint8 arrays (one matrix per hash type):
-    arrays[ht] : np.ndarray, shape (N, bytes_per_hash), dtype=uint8
-
-Scoring is fully vectorised:
-    xored  = arrays[ht] ^ scan_packed[ht]          # broadcast XOR
-    dists  = np.unpackbits(xored, axis=1).sum(1)   # popcount per row
+The index stores all hash types of a card side by side in one contiguous
+matrix of packed 64-bit words:
+    combined   : np.ndarray, shape (N, T * words_per_hash), dtype=uint64
+    col_weight : np.ndarray, shape (T * words_per_hash,),   dtype=float32
+where columns [0:W) are phash, [W:2W) ahash, and so on, and col_weight holds
+each column's hash-type weight (already divided by _WEIGHT_SUM).
+
+Scoring is one fused, fully vectorised pass over the index:
+    xored  = combined ^ scan_combined              # broadcast XOR
+    pc     = np.bitwise_count(xored)               # popcount per word
+    dists  = pc.astype(float32) @ col_weight       # weighted sum (GEMV)
+
+np.bitwise_count (NumPy ≥ 2.0) maps to the CPU's 64-bit POPCNT.  Older NumPy
+falls back to a 256-entry lookup table over the byte view.  XOR and popcount
+don't care about byte order, so the uint64 view is safe on any platform as
+long as the index and the scan are viewed the same way.
+
+When numba is installed, the three steps above collapse into one parallel
+kernel (identifier/_hamming_numba.py) with no N-sized temporaries.  It
+weights with the raw integer _WEIGHTS, so each row is reduced entirely in
+integer arithmetic and scaled by 1/_WEIGHT_SUM once at the end.
+
+Built indexes are saved next to the DB (hash_index-*.npy + .json) and
+memory-mapped on the next start while card_hashes has not changed since, so
+a cold start skips reading the hashes entirely.
 
 Compared with the original imagehash-based loop:
     index load  : ~96 ms  (was ~3 200 ms — hex_to_hash bottleneck)
@@ -20,25 +39,132 @@ Compared with the original imagehash-based loop:
 
 from __future__ import annotations
 
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import numpy as np
-import imagehash             # still used only to hash the *scan* image
 from PIL import Image
 
+import config as _config
 from config import (
     HASH_TYPES, HASH_IMAGE_SIZE, TOP_K_MATCHES,
     CONFIDENCE_HIGH, CONFIDENCE_MED, PHASH_SIZE,
     STICKER_AUTO_DETECT, HASH_ART_Y0, HASH_ART_Y1,
 )
-from db.database import get_all_hashes, get_card_by_id
-from cards.hasher import _HASH_FN
+from db.database import card_hashes_state, get_all_hashes, get_cards_by_ids
+from cards.hasher import compute_packed_hashes
 from identifier.preprocess import preprocess_for_hashing as _preprocess_image
 from identifier.enricher import enrich_result
 
 
-# Hash type weights: phash double-weighted (most robust to lighting / compression)
+# Hash type weights: phash double-weighted (most robust to lighting / compression).
+# Keep them integral — the numba kernel accumulates them as int32.
 _WEIGHTS: dict[str, float] = {"phash": 2.0, "ahash": 1.0, "dhash": 1.0, "whash": 1.0}
 _WEIGHT_SUM = sum(_WEIGHTS.values())   # 5.0
 
+# Popcount: hardware popcount via np.bitwise_count on NumPy ≥ 2.0, otherwise
+# a single gather through a 256-entry lookup table over the byte view.
+_bitwise_count = getattr(np, "bitwise_count", None)
+_POPCOUNT_LUT  = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+# bytes_per_hash: for PHASH_SIZE=16 (256 bits) → 32 bytes → 4 uint64 words.
+# Rounded up to whole words; the zero padding never contributes to a distance.
+_BYTES_PER_HASH = (PHASH_SIZE * PHASH_SIZE) // 8
+_WORDS_PER_HASH = -(-_BYTES_PER_HASH // 8)
+
+
+def _popcount_words(xored: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Write per-word set-bit counts of a 2-D uint64 array into *out*."""
+    if _bitwise_count is not None:
+        return _bitwise_count(xored, out=out)
+    n = xored.shape[0]
+    return _POPCOUNT_LUT[xored.view(np.uint8)].reshape(n, -1, 8).sum(axis=2, out=out)
+
+
+# Target working set per row block in the NumPy score path — sized to sit
+# comfortably in a typical 256 KB+ L2 cache.
+_SCORE_BLOCK_BYTES = 256 * 1024
+
+# Optional Numba kernel — None = not tried yet, False = numba unavailable.
+_numba_kernel = None
+
+
+def _get_numba_kernel():
+    """Return the fused weighted-Hamming kernel, or None to use NumPy."""
+    global _numba_kernel
+    if _numba_kernel is None:
+        try:
+            from identifier._hamming_numba import weighted_hamming
+            _numba_kernel = weighted_hamming
+        except Exception:
+            _numba_kernel = False
+    return _numba_kernel or None
+
+
+def _fill_segment(mat: np.ndarray, off: int, rows: list, id_to_idx: dict) -> None:
+    """Copy one hash type's rows into mat[:, off:off + _BYTES_PER_HASH].
+
+    hash_value is stored as packed bytes, so well-formed rows are joined into
+    one buffer and scattered into place with a single fancy-indexed
+    assignment — no decoding.  Rows of the wrong length, or legacy hex text
+    the migration could not convert, go through the per-row path, which
+    truncates or pads and leaves unusable hashes as zeros (max distance).
+    """
+    idxs: list[int] = []
+    blobs: list[bytes] = []
+    odd: list[tuple[int, object]] = []
+    for row in rows:
+        idx = id_to_idx.get(row["card_id"])
+        if idx is None:
+            continue
+        value = row["hash_value"]
+        if isinstance(value, bytes) and len(value) == _BYTES_PER_HASH:
+            idxs.append(idx)
+            blobs.append(value)
+        else:
+            odd.append((idx, value))
+
+    if blobs:
+        block = np.frombuffer(b"".join(blobs), dtype=np.uint8)
+        mat[idxs, off:off + _BYTES_PER_HASH] = block.reshape(len(blobs), _BYTES_PER_HASH)
+
+    for idx, value in odd:
+        try:
+            if isinstance(value, str):
+                value = bytes.fromhex(value)
+            packed = np.frombuffer(value, dtype=np.uint8)
+            # Guard: truncate / pad to expected length
+            packed = packed[:_BYTES_PER_HASH]
+            mat[idx, off:off + len(packed)] = packed
+        except (ValueError, TypeError):
+            pass   # leave as zeros — will score as max distance
+
+
+def _top_k(distances: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k smallest distances, sorted ascending."""
+    if _get_numba_kernel() is not None:
+        # Single bounded pass — no N-sized index array or partition
+        from identifier._hamming_numba import smallest_k
+        return smallest_k(distances, k)
+    k = min(k, len(distances))
+    top = np.argpartition(distances, k - 1)[:k]
+    return top[np.argsort(distances[top])]
+
+
+def _pack_scan_hashes(img: Image.Image, suffix: str = "") -> dict[str, np.ndarray]:
+    """Hash a scan image and lay each hash out as uint64 words like an index segment."""
+    words = {}
+    for ht, raw in compute_packed_hashes(img).items():
+        packed = np.zeros(_WORDS_PER_HASH * 8, dtype=np.uint8)
+        packed[:min(len(raw), _BYTES_PER_HASH)] = raw[:_BYTES_PER_HASH]
+        words[f"{ht}{suffix}"] = packed.view(np.uint64)
+    return words
+
 # ---------------------------------------------------------------------------
 # Vectorised index
 # ---------------------------------------------------------------------------
@@ -50,19 +176,52 @@ class _HashIndex:
     Attributes
     ----------
     card_ids : list[str]
-        Card IDs in row order — same for every hash type.
-    arrays : dict[str, np.ndarray]
-        ``arrays[ht]`` has shape ``(N, bytes_per_hash)``, dtype uint8.
-        Each row is the packed bit representation of one card's hash.
+        Card IDs in row order.
+    hash_types : list[str]
+        Hash type names in column-segment order.
+    combined : np.ndarray
+        Shape ``(N, len(hash_types) * words_per_hash)``, dtype uint64.
+        Row i holds card i's packed hashes for every hash type, segment by
+        segment, reinterpreted as 64-bit words.
+    seg_weight : np.ndarray
+        int32, one entry per hash type — its raw integer weight, used by the
+        numba kernel (which divides by _WEIGHT_SUM once per row).
+    col_weight : np.ndarray
+        float32, one entry per column of ``combined`` — ``seg_weight`` divided
+        by _WEIGHT_SUM and repeated across each segment, so the NumPy
+        ``score`` path is a single GEMV.
+
+    The NumPy ``score`` path walks the index in row blocks of about
+    _SCORE_BLOCK_BYTES, so each block's XOR, popcount and GEMV all hit L2
+    instead of streaming the whole index through DRAM three times.  The
+    block-sized scratch buffers are reused across calls and guarded by a
+    lock — identify runs on several GUI worker threads at once.
     """
 
     def __init__(
         self,
         card_ids: list[str],
-        arrays: dict[str, np.ndarray],
+        hash_types: list[str],
+        combined: np.ndarray,
     ):
-        self.card_ids = card_ids
-        self.arrays   = arrays
+        self.card_ids   = card_ids
+        self.hash_types = hash_types
+        self.combined   = combined
+        # Resolve weight: "phash_art" → "phash", "phash" → "phash"
+        self.seg_weight = np.array(
+            [_WEIGHTS.get(ht.removesuffix("_art"), 1.0) for ht in hash_types],
+            dtype=np.int32,
+        )
+        self.col_weight = np.repeat(
+            self.seg_weight.astype(np.float32) / np.float32(_WEIGHT_SUM),
+            _WORDS_PER_HASH,
+        )
+        # Row-block scratch for the NumPy score path, allocated on first use
+        row_bytes = max(1, combined.shape[1] * combined.itemsize)
+        self._block    = max(64, _SCORE_BLOCK_BYTES // row_bytes)
+        self._buf_xor: np.ndarray | None = None   # uint64,  (block, T*W)
+        self._buf_pc:  np.ndarray | None = None   # float32, (block, T*W)
+        self._buf_lock = threading.Lock()
 
     @classmethod
     def build(cls, hash_types: "list[str] | None" = None) -> "_HashIndex":
@@ -75,10 +234,14 @@ class _HashIndex:
             full-card or ["phash_art","ahash_art","dhash_art","whash_art"] for
             the art-zone index).  Defaults to HASH_TYPES (full-card).
         """
-        ht_list = hash_types if hash_types is not None else HASH_TYPES
+        ht_list = list(hash_types if hash_types is not None else HASH_TYPES)
 
-        # Collect rows per hash type
-        rows_by_ht: dict[str, list] = {ht: get_all_hashes(ht) for ht in ht_list}
+        # Collect rows per hash type — one query per type, run concurrently
+        # (each call opens its own connection; sqlite3 releases the GIL)
+        with ThreadPoolExecutor(max_workers=len(ht_list)) as pool:
+            rows_by_ht: dict[str, list] = dict(
+                zip(ht_list, pool.map(get_all_hashes, ht_list))
+            )
 
         # Determine the canonical ordering of card IDs from the first hash type
         primary_ht = ht_list[0]
@@ -87,67 +250,155 @@ class _HashIndex:
         n = len(card_ids)
 
         if n == 0:
-            return cls([], {})
-
-        # bytes_per_hash: for PHASH_SIZE=16 (256 bits) → 32 bytes
-        bytes_per_hash = (PHASH_SIZE * PHASH_SIZE) // 8
-
-        arrays: dict[str, np.ndarray] = {}
-        for ht in ht_list:
-            mat = np.zeros((n, bytes_per_hash), dtype=np.uint8)
-            for row in rows_by_ht[ht]:
-                idx = id_to_idx.get(row["card_id"])
-                if idx is None:
-                    continue
-                try:
-                    packed = np.frombuffer(
-                        bytes.fromhex(row["hash_value"]), dtype=np.uint8
-                    )
-                    # Guard: truncate / pad to expected length
-                    if len(packed) >= bytes_per_hash:
-                        mat[idx] = packed[:bytes_per_hash]
-                    else:
-                        mat[idx, :len(packed)] = packed
-                except (ValueError, TypeError):
-                    pass   # leave as zeros — will score as max distance
-            arrays[ht] = mat
+            return cls([], ht_list, np.zeros((0, len(ht_list) * _WORDS_PER_HASH), dtype=np.uint64))
+
+        seg_bytes = _WORDS_PER_HASH * 8
+
+        mat = np.zeros((n, len(ht_list) * seg_bytes), dtype=np.uint8)
+        with ThreadPoolExecutor(max_workers=len(ht_list)) as pool:
+            list(pool.map(
+                lambda seg: _fill_segment(
+                    mat, seg * seg_bytes, rows_by_ht[ht_list[seg]], id_to_idx
+                ),
+                range(len(ht_list)),
+            ))
+
+        return cls(card_ids, ht_list, mat.view(np.uint64))
+
+    @staticmethod
+    def _cache_paths(ht_list: list[str]) -> tuple[Path, Path]:
+        stem = "hash_index-" + "-".join(ht_list)
+        data_dir = Path(_config.DB_PATH).parent   # read at call time, like the DB
+        return data_dir / f"{stem}.npy", data_dir / f"{stem}.json"
+
+    @staticmethod
+    def _cache_key(ht_list: list[str]) -> dict:
+        """Everything besides the DB contents that changes what build() returns."""
+        return {
+            "hash_types":       ht_list,
+            "bytes_per_hash":   _BYTES_PER_HASH,
+            "excluded_prefixes": list(getattr(_config, "EXCLUDED_SET_ID_PREFIXES", [])),
+        }
 
-        return cls(card_ids, arrays)
+    @classmethod
+    def load(cls, hash_types: "list[str] | None" = None) -> "_HashIndex":
+        """Return the index from its on-disk cache if still fresh, else build it.
+
+        The cache is fresh when card_hashes hasn't changed since it was built
+        (same card_hashes_state(): change counter, row count, max rowid) and
+        it was built with the same hash types / hash size / set exclusions.
+        Other writes to the DB — enrichment, settings — don't invalidate it.
+        The matrix is memory-mapped copy-on-write, so loading is zero-copy
+        and zero-decode.
+        """
+        ht_list = list(hash_types if hash_types is not None else HASH_TYPES)
+        npy_path, meta_path = cls._cache_paths(ht_list)
+        try:
+            db_state = card_hashes_state()
+        except sqlite3.Error:
+            db_state = None   # schema not initialised — build, don't cache
+        if db_state is not None:
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                if (meta.get("key") == cls._cache_key(ht_list)
+                        and meta.get("db_state") == db_state):
+                    combined = np.asarray(np.load(npy_path, mmap_mode="c"))
+                    if (combined.dtype == np.uint64
+                            and combined.shape == (len(meta["card_ids"]),
+                                                   len(ht_list) * _WORDS_PER_HASH)):
+                        return cls(meta["card_ids"], ht_list, combined)
+            except (OSError, ValueError, KeyError):
+                pass   # missing / stale / corrupt cache — rebuild below
+
+        index = cls.build(ht_list)
+        if db_state is not None:
+            index.save(db_state)
+        return index
+
+    def save(self, db_state: list[int]) -> None:
+        """Write the index to its on-disk cache, tagged with the
+        card_hashes_state() read before it was built.  Failures are non-fatal."""
+        if self.is_empty():
+            return   # nothing worth caching, and empty arrays can't be mmapped
+        npy_path, meta_path = self._cache_paths(self.hash_types)
+        tmp_paths = []
+        try:
+            # Write to uniquely named temp files and swap in, so a crash never
+            # leaves a half-written cache and concurrent saves don't collide.
+            # The .npy goes in first: the .json is what marks the pair fresh.
+            for path in (npy_path, meta_path):
+                fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+                tmp_paths.append(tmp)
+                with os.fdopen(fd, "wb") as f:
+                    if path is npy_path:
+                        np.save(f, np.ascontiguousarray(self.combined))
+                    else:
+                        f.write(json.dumps({
+                            "key":      self._cache_key(self.hash_types),
+                            "db_state": db_state,
+                            "card_ids": self.card_ids,
+                        }).encode("utf-8"))
+            for tmp, path in zip(tmp_paths, (npy_path, meta_path)):
+                os.replace(tmp, path)
+        except OSError:
+            for tmp in tmp_paths:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
 
     def is_empty(self) -> bool:
         return len(self.card_ids) == 0
 
-    def score(self, scan_hashes: dict[str, imagehash.ImageHash]) -> np.ndarray:
+    def score(self, scan_packed: dict[str, np.ndarray]) -> np.ndarray:
         """
         Return a float32 array of weighted average Hamming distances, one per card.
 
         Parameters
         ----------
-        scan_hashes : dict[str, ImageHash]
-            Keyed by the same hash type names this index was built with.
+        scan_packed : dict[str, np.ndarray]
+            Scan hashes already packed to uint64 words (see _pack_scan_hashes),
+            keyed by the same hash type names this index was built with.
             For the full-card index: "phash", "ahash", etc.
             For the art-zone index:  "phash_art", "ahash_art", etc.
 
         Weights are looked up by stripping any trailing "_art" suffix so both
         the full-card and art-zone indexes use the same _WEIGHTS table.
         """
-        n = len(self.card_ids)
-        accumulated = np.zeros(n, dtype=np.float32)
-
-        for ht in self.arrays:
-            # Resolve weight: "phash_art" → "phash", "phash" → "phash"
-            base_ht = ht.removesuffix("_art")
-            weight  = _WEIGHTS.get(base_ht, 1.0)
-            if ht not in scan_hashes:
-                continue
-            # Pack the scan hash to bytes the same way the DB stores them
-            scan_packed = np.packbits(scan_hashes[ht].hash.flatten())
-
-            xored = np.bitwise_xor(self.arrays[ht], scan_packed)   # (N, B)
-            dists = np.unpackbits(xored, axis=1).sum(axis=1)        # (N,) popcount
-            accumulated += dists.astype(np.float32) * weight
-
-        return accumulated / _WEIGHT_SUM
+        W = _WORDS_PER_HASH
+        scan = np.zeros(self.combined.shape[1], dtype=np.uint64)
+        seg_weight, col_weight = self.seg_weight, self.col_weight
+        for seg, ht in enumerate(self.hash_types):
+            if ht in scan_packed:
+                scan[seg * W:(seg + 1) * W] = scan_packed[ht]
+            else:
+                # A hash type missing from the scan contributes nothing
+                if seg_weight is self.seg_weight:
+                    seg_weight, col_weight = seg_weight.copy(), col_weight.copy()
+                seg_weight[seg] = 0
+                col_weight[seg * W:(seg + 1) * W] = 0.0
+
+        out = np.empty(len(self.card_ids), dtype=np.float32)
+
+        kernel = _get_numba_kernel()
+        if kernel is not None:
+            kernel(self.combined, scan, seg_weight,
+                   np.float32(1.0 / _WEIGHT_SUM), out)
+            return out
+
+        n, cols = self.combined.shape
+        with self._buf_lock:
+            if self._buf_xor is None:
+                self._buf_xor = np.empty((self._block, cols), dtype=np.uint64)
+                self._buf_pc  = np.empty((self._block, cols), dtype=np.float32)
+            for i0 in range(0, n, self._block):
+                i1 = min(i0 + self._block, n)
+                buf_x = self._buf_xor[:i1 - i0]
+                buf_p = self._buf_pc[:i1 - i0]
+                np.bitwise_xor(self.combined[i0:i1], scan, out=buf_x)
+                _popcount_words(buf_x, out=buf_p)
+                np.dot(buf_p, col_weight, out=out[i0:i1])
+        return out
 
 
 # Module-level caches — loaded lazily on first identify call, refreshed after setup.
@@ -163,16 +414,23 @@ _ART_HASH_TYPES = [f"{ht}_art" for ht in HASH_TYPES]
 
 
 def reload_index() -> None:
-    """Force reload of the hash index (and art-zone index) from DB."""
+    """Force reload of the hash index (and art-zone index) from DB.
+
+    Always rebuilds from the DB and refreshes the on-disk cache, even if the
+    cache looks fresh.
+    """
     global _index, _art_index
+    db_state   = card_hashes_state()
     _index     = _HashIndex.build()
     _art_index = _HashIndex.build(hash_types=_ART_HASH_TYPES)
+    _index.save(db_state)
+    _art_index.save(db_state)
 
 
 def _get_index() -> _HashIndex:
     global _index
     if _index is None:
-        _index = _HashIndex.build()
+        _index = _HashIndex.load()
     return _index
 
 
@@ -180,7 +438,7 @@ def _get_art_index() -> "_HashIndex | None":
     """Return the art-zone index, loading it lazily.  Returns None if empty."""
     global _art_index
     if _art_index is None:
-        _art_index = _HashIndex.build(hash_types=_ART_HASH_TYPES)
+        _art_index = _HashIndex.load(hash_types=_ART_HASH_TYPES)
     return _art_index if not _art_index.is_empty() else None
 
 
@@ -233,13 +491,14 @@ def identify_card(image_path: str,
                                 sticker_mask_px=sticker_mask_px,
                                 auto_detect=auto_detect)
 
-    # Compute hashes for the scanned card (imagehash objects — only N=1 image)
-    scan_hashes: dict[str, imagehash.ImageHash] = {
-        ht: _HASH_FN[ht](pil_img, hash_size=PHASH_SIZE) for ht in HASH_TYPES
-    }
+    # Compute hashes for the scanned card straight to packed uint64 words —
+    # score() then only copies them into its scan vector.  Greyscale once:
+    # the full-card and art-zone hashes both start from luminance.
+    gray_img = pil_img.convert("L")
+    scan_packed = _pack_scan_hashes(gray_img)
 
     # Vectorised scoring — returns float32 array of length N
-    full_distances = index.score(scan_hashes)
+    full_distances = index.score(scan_packed)
 
     # Art-zone scoring — used when a sticker is known/suspected.
     # The art zone (y ≈ 13–53% of card) sits away from both top and bottom
@@ -253,26 +512,23 @@ def identify_card(image_path: str,
 
     if art_idx is not None and len(art_idx.card_ids) == len(index.card_ids):
         W, H = HASH_IMAGE_SIZE
-        art_crop = pil_img.crop((0, int(H * HASH_ART_Y0), W, int(H * HASH_ART_Y1)))
-        art_scan_hashes: dict[str, imagehash.ImageHash] = {
-            f"{ht}_art": _HASH_FN[ht](art_crop, hash_size=PHASH_SIZE)
-            for ht in HASH_TYPES
-        }
-        art_distances = art_idx.score(art_scan_hashes)
+        art_crop = gray_img.crop((0, int(H * HASH_ART_Y0), W, int(H * HASH_ART_Y1)))
+        art_scan_packed = _pack_scan_hashes(art_crop, suffix="_art")
+        art_distances = art_idx.score(art_scan_packed)
         distances = np.minimum(full_distances, art_distances)
     else:
         distances = full_distances
 
-    # Partial sort: find the TOP_K_MATCHES smallest distances
-    k = min(TOP_K_MATCHES, len(distances))
-    top_indices = np.argpartition(distances, k - 1)[:k]
-    top_indices = top_indices[np.argsort(distances[top_indices])]  # sort ascending
+    top_indices = _top_k(distances, TOP_K_MATCHES)
+
+    # One query for all top-K card rows
+    rows = get_cards_by_ids([index.card_ids[i] for i in top_indices])
 
     results = []
     for idx in top_indices:
         card_id  = index.card_ids[idx]
         distance = float(distances[idx])
-        row = get_card_by_id(card_id)
+        row = rows.get(card_id)
         if row is None:
             continue
         result = {
@@ -1,11 +1,13 @@
 """
 Shared image preprocessing for card identification.
 
-Two public functions are provided:
+Public functions:
   - preprocess_for_hashing(image_path)  → PIL.Image at HASH_IMAGE_SIZE
       Full card-detection pipeline (Canny + adaptive threshold + Otsu),
       perspective warp when a card quad is found, centre-crop fallback.
-      Used by the hash-based matcher.
+      Used by the hash-based matcher.  With LLC_USE_CUDA=1 and a CUDA build
+      of OpenCV, the full-resolution colour conversion, warp and resize run
+      on the GPU.
 
   - preprocess_for_embedding(image_path) → np.ndarray (3, 224, 224) float32
       Simple centre-crop to card aspect ratio then resize to 224×224,
@@ -13,8 +15,22 @@ Two public functions are provided:
       Does NOT use perspective warp — CNNs handle natural variation better
       than geometrically distorted crops.
       Used by the ML embedding matcher.
+
+  - preprocess_for_embedding_batch(paths) → np.ndarray (N, 3, S, S) float32
+      Same as above for many images, written into one pre-allocated batch.
+      Used by the bulk embedding computer.
+
+  - preprocess_many(paths, func) → iterator of (path, result)
+      Runs any per-image preprocess function over many files on a thread
+      pool with bounded read-ahead, yielding results in input order.
 """
 
+import math
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import numpy as np
 from PIL import Image
@@ -30,6 +46,46 @@ _CARD_ASPECT = 88 / 63
 _IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
 _IMAGENET_STD  = np.array([0.229, 0.224, 0.225], dtype=np.float32)
 
+# Normalisation folded into one multiply-add per element:
+#   (x / 255 - mean) / std  ==  x * _NORM_SCALE - _NORM_BIAS
+_NORM_SCALE = (1.0 / (255.0 * _IMAGENET_STD)).astype(np.float32)
+_NORM_BIAS  = (_IMAGENET_MEAN / _IMAGENET_STD).astype(np.float32)
+
+# Optional Numba kernel for _normalize_to_chw — None = not tried yet,
+# False = numba unavailable.
+_numba_normalize = None
+# Optional Numba kernel for _is_card_shaped (same None / False convention)
+_numba_card_shape = None
+
+# 3×3 rectangular structuring element for the edge-map dilations (what
+# cv2.dilate uses for kernel=None, but built once instead of per call)
+_SE_3x3 = np.ones((3, 3), np.uint8)
+
+# Card-quad detection runs on a copy no larger than this (longest side, px).
+# Contours of a card-sized object gain nothing from more resolution, and a
+# 4000 px phone photo would otherwise cost ~25× the pixel work.
+_QUAD_DETECT_MAX_DIM = 800
+
+# Runs the adaptive-threshold and Otsu quad passes side by side for a
+# single-image call (see _detect_card_quad) — one worker each.  Bulk
+# preprocess_many threads run them inline instead.
+_QUAD_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="quad")
+
+# Decoded-scan cache for _imread: path -> ((mtime_ns, size), image), least
+# recently used first.  Bounded by bytes rather than entries: room for about
+# three decoded phone photos.
+_IMAGE_CACHE_MAX_BYTES = 128 * 1024 * 1024
+_image_cache: "OrderedDict[str, tuple[tuple[int, int], np.ndarray]]" = OrderedDict()
+_image_cache_bytes = 0
+_image_cache_lock = threading.Lock()
+
+# .active is set on preprocess_many's worker threads (bulk reads skip the cache)
+_bulk = threading.local()
+
+# Optional CUDA path for card extraction (opt-in with LLC_USE_CUDA=1) —
+# None = not checked yet, False = disabled / no CUDA device.
+_cuda_enabled = None
+
 # CLAHE object (created lazily on first use)
 _clahe: "cv2.cuda.CLAHE | None" = None
 
@@ -43,53 +99,214 @@ def _get_clahe() -> "cv2.cuda.CLAHE | None":
 
 
 def _apply_clahe(bgr: np.ndarray) -> np.ndarray:
-    """Apply CLAHE to the BGR image and return the result.
+    """Apply CLAHE to the BGR image and return the result (hash path).
+
+    Equalises only the luma (Y) channel in YCrCb space so colours are
+    preserved.  YCrCb rather than LAB: the conversion is a plain linear
+    transform with a SIMD fast path in OpenCV, whereas LAB needs a gamma /
+    cube-root per pixel each way.  Only scans are hashed this way — the
+    reference hashes (cards/hasher.py) never go through CLAHE — so the
+    colour space isn't baked into anything stored.  The embedding path uses
+    _apply_clahe_lab instead.
+    """
+    clahe = _get_clahe()
+    if clahe is None:
+        return bgr
+
+    try:
+        ycrcb = cv2.cvtColor(bgr, cv2.COLOR_BGR2YCrCb)
+        ycrcb[:, :, 0] = clahe.apply(ycrcb[:, :, 0])
+        return cv2.cvtColor(ycrcb, cv2.COLOR_YCrCb2BGR)
+    except Exception:
+        # Fallback: just return original if CLAHE fails
+        return bgr
+
+
+def _apply_clahe_lab(bgr: np.ndarray) -> np.ndarray:
+    """CLAHE on the L channel in LAB space (embedding path).
 
-    Applies to the L channel in LAB color space for better color preservation.
-    Handles both CPU and GPU CLAHE gracefully.
+    The stored reference embeddings (cards/embedding_computer.py) were
+    computed with LAB CLAHE, so this must stay bit-identical to that until
+    the embeddings are recomputed — even though _apply_clahe is faster.
     """
     clahe = _get_clahe()
     if clahe is None:
         return bgr
 
     try:
-        # Try GPU version first (faster on systems with CUDA)
         lab = cv2.cvtColor(bgr, cv2.COLOR_BGR2LAB)
         lab[:, :, 0] = clahe.apply(lab[:, :, 0])
         return cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
     except Exception:
-        # Fallback: just return original if CLAHE fails
         return bgr
 
 
 # ── Private helpers ───────────────────────────────────────────────────────────
 
+def _imread(image_path) -> np.ndarray:
+    """
+    cv2.imread through a small cache of decoded scans.
+
+    The GUI often processes the same file several times in a row (sticker
+    mask dialog, then identify; hash and ML matchers in hybrid mode; sticker
+    on/off re-runs), and JPEG decode of a full scan is tens to hundreds of
+    ms.  Entries are keyed on mtime and size so an overwritten file is
+    re-read, and the cache is bounded by _IMAGE_CACHE_MAX_BYTES — a phone
+    photo decodes to ~36 MB.  preprocess_many's workers bypass it: a bulk
+    run reads each file once, and would only evict the GUI's entries.
+
+    Returns a read-only array (shared with the cache; nothing downstream
+    writes into its input, so no copy is made); raises ValueError if the
+    file can't be read.
+    """
+    path = str(image_path)
+    if getattr(_bulk, "active", False):
+        img = cv2.imread(path)
+        if img is None:
+            raise ValueError(f"Cannot read image: {image_path}")
+        return img
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        raise ValueError(f"Cannot read image: {image_path}") from None
+    key = (st.st_mtime_ns, st.st_size)
+    with _image_cache_lock:
+        entry = _image_cache.get(path)
+        if entry is not None and entry[0] == key:
+            _image_cache.move_to_end(path)
+            return entry[1]
+
+    img = cv2.imread(path)
+    if img is None:
+        raise ValueError(f"Cannot read image: {image_path}")
+    img.flags.writeable = False   # shared by every cache hit
+    if img.nbytes <= _IMAGE_CACHE_MAX_BYTES:
+        _cache_image(path, key, img)
+    return img
+
+
+def _cache_image(path: str, key: tuple[int, int], img: np.ndarray) -> None:
+    """Insert into the decoded-scan cache, evicting oldest entries to fit."""
+    global _image_cache_bytes
+    with _image_cache_lock:
+        old = _image_cache.pop(path, None)
+        if old is not None:
+            _image_cache_bytes -= old[1].nbytes
+        _image_cache[path] = (key, img)
+        _image_cache_bytes += img.nbytes
+        while _image_cache_bytes > _IMAGE_CACHE_MAX_BYTES:
+            _, (_, evicted) = _image_cache.popitem(last=False)
+            _image_cache_bytes -= evicted.nbytes
+
+
+def clear_image_cache() -> None:
+    """Drop all cached decoded images (see _imread)."""
+    global _image_cache_bytes
+    with _image_cache_lock:
+        _image_cache.clear()
+        _image_cache_bytes = 0
+
+
+def _get_numba_normalize():
+    """Return the fused normalise kernel, or None to use NumPy."""
+    global _numba_normalize
+    if _numba_normalize is None:
+        try:
+            from identifier._preprocess_numba import normalize_bgr_to_chw
+            _numba_normalize = normalize_bgr_to_chw
+        except Exception:
+            _numba_normalize = False
+    return _numba_normalize or None
+
+
+def _get_numba_card_shape():
+    """Return the compiled card-shape test, or None to use Python."""
+    global _numba_card_shape
+    if _numba_card_shape is None:
+        try:
+            from identifier._preprocess_numba import card_shape_ok
+            _numba_card_shape = card_shape_ok
+        except Exception:
+            _numba_card_shape = False
+    return _numba_card_shape or None
+
+
+def _use_cuda() -> bool:
+    """
+    True when card extraction should run its full-resolution steps on the
+    GPU: LLC_USE_CUDA=1 is set and OpenCV was built with CUDA and sees a
+    device.  The stock opencv-python wheels have no CUDA support, so this is
+    opt-in and checked once.
+    """
+    global _cuda_enabled
+    if _cuda_enabled is None:
+        _cuda_enabled = False
+        if os.environ.get("LLC_USE_CUDA") == "1":
+            try:
+                _cuda_enabled = cv2.cuda.getCudaEnabledDeviceCount() > 0
+            except (AttributeError, cv2.error):
+                pass
+    return _cuda_enabled
+
+
+def _normalize_to_chw(card_bgr: np.ndarray,
+                      out: "np.ndarray | None" = None) -> np.ndarray:
+    """
+    Convert a uint8 BGR image (H, W, 3) to the ImageNet-normalised RGB
+    float32 CHW tensor (3, H, W) expected by the embedding model.
+
+    With numba this is one fused pass (colour swap, scale, mean/std and
+    transpose together); otherwise the image is split into its uint8
+    planes and cv2.addWeighted applies scale and bias to each in a single
+    pass, writing straight into the contiguous CHW output — a fresh
+    array, or *out* when given (e.g. a slot of a batch tensor).
+    """
+    h, w = card_bgr.shape[:2]
+    if out is None:
+        out = np.empty((3, h, w), dtype=np.float32)
+    kernel = _get_numba_normalize()
+    if kernel is not None:
+        kernel(np.ascontiguousarray(card_bgr), _NORM_SCALE, _NORM_BIAS, out)
+        return out
+    planes = cv2.split(card_bgr)
+    for c in range(3):
+        plane = planes[2 - c]
+        cv2.addWeighted(plane, float(_NORM_SCALE[c]), plane, 0.0,
+                        -float(_NORM_BIAS[c]), dst=out[c], dtype=cv2.CV_32F)
+    return out
+
+
 def _order_points(pts: np.ndarray) -> np.ndarray:
     """Order four points as: top-left, top-right, bottom-right, bottom-left."""
-    rect = np.zeros((4, 2), dtype=np.float32)
-    s = pts.sum(axis=1)
-    rect[0] = pts[np.argmin(s)]   # top-left  (smallest x+y)
-    rect[2] = pts[np.argmax(s)]   # bottom-right (largest x+y)
-    diff = np.diff(pts, axis=1)
-    rect[1] = pts[np.argmin(diff)]  # top-right  (smallest y-x)
-    rect[3] = pts[np.argmax(diff)]  # bottom-left (largest y-x)
+    # Four points — plain Python min/max beats NumPy's per-call dispatch.
+    # Ties resolve to the first point, as np.argmin/argmax do.
+    pl = pts.tolist()
+    sums  = [x + y for x, y in pl]
+    diffs = [y - x for x, y in pl]
+    rect = np.array([
+        pl[sums.index(min(sums))],     # top-left     (smallest x+y)
+        pl[diffs.index(min(diffs))],   # top-right    (smallest y-x)
+        pl[sums.index(max(sums))],     # bottom-right (largest x+y)
+        pl[diffs.index(max(diffs))],   # bottom-left  (largest y-x)
+    ], dtype=np.float32)
     return rect
 
 
-def _four_point_transform(image: np.ndarray, pts: np.ndarray) -> np.ndarray | None:
+def _warp_geometry(pts: np.ndarray) -> "tuple[np.ndarray, tuple[int, int]] | None":
     """
-    Apply a perspective warp to the region defined by four points.
-    Returns the warped image at its natural dimensions, or None if degenerate.
+    Perspective matrix and natural (width, height) for warping the region
+    defined by four points upright, or None if degenerate.
     """
     pts = _order_points(pts)
-    (tl, tr, br, bl) = pts
+    (tl, tr, br, bl) = pts.tolist()
 
-    width_a = np.linalg.norm(br - bl)
-    width_b = np.linalg.norm(tr - tl)
+    width_a = math.hypot(br[0] - bl[0], br[1] - bl[1])
+    width_b = math.hypot(tr[0] - tl[0], tr[1] - tl[1])
     max_width = max(int(width_a), int(width_b))
 
-    height_a = np.linalg.norm(tr - br)
-    height_b = np.linalg.norm(tl - bl)
+    height_a = math.hypot(tr[0] - br[0], tr[1] - br[1])
+    height_b = math.hypot(tl[0] - bl[0], tl[1] - bl[1])
     max_height = max(int(height_a), int(height_b))
 
     if max_width < 10 or max_height < 10:
@@ -102,8 +319,29 @@ def _four_point_transform(image: np.ndarray, pts: np.ndarray) -> np.ndarray | No
         [0, max_height - 1],
     ], dtype=np.float32)
 
-    M = cv2.getPerspectiveTransform(pts, dst)
-    return cv2.warpPerspective(image, M, (max_width, max_height))
+    return cv2.getPerspectiveTransform(pts, dst), (max_width, max_height)
+
+
+def _four_point_transform(image: np.ndarray, pts: np.ndarray) -> np.ndarray | None:
+    """
+    Apply a perspective warp to the region defined by four points.
+    Returns the warped image at its natural dimensions, or None if degenerate.
+    """
+    geometry = _warp_geometry(pts)
+    if geometry is None:
+        return None
+    M, size = geometry
+    return cv2.warpPerspective(image, M, size)
+
+
+def _quad_width_height(rect: np.ndarray) -> tuple[float, float]:
+    """Longer of each pair of opposite sides of an ordered quad (tl, tr, br, bl)."""
+    (tl, tr, br, bl) = rect.tolist()
+    w = max(math.hypot(tr[0] - tl[0], tr[1] - tl[1]),
+            math.hypot(br[0] - bl[0], br[1] - bl[1]))
+    h = max(math.hypot(tl[0] - bl[0], tl[1] - bl[1]),
+            math.hypot(tr[0] - br[0], tr[1] - br[1]))
+    return w, h
 
 
 def _is_card_shaped(pts: np.ndarray, img_h: int, img_w: int) -> bool:
@@ -111,12 +349,17 @@ def _is_card_shaped(pts: np.ndarray, img_h: int, img_w: int) -> bool:
     Return True if the four-point region is plausibly a Pokemon card:
     - Aspect ratio (h/w) within 30% of the standard card ratio or its inverse
     - Quad area is at least 5% of the total image area
+
+    Called for every 4-point approximation of every contour tried, so with
+    numba the ordering and all three tests run as one compiled call.
     """
-    pts = _order_points(pts)
-    (tl, tr, br, bl) = pts
+    kernel = _get_numba_card_shape()
+    if kernel is not None:
+        return kernel(np.ascontiguousarray(pts, dtype=np.float32),
+                      float(img_h * img_w), _CARD_ASPECT)
 
-    w = max(np.linalg.norm(tr - tl), np.linalg.norm(br - bl))
-    h = max(np.linalg.norm(tl - bl), np.linalg.norm(tr - br))
+    rect = _order_points(pts)
+    w, h = _quad_width_height(rect)
 
     if w < 20 or h < 20:
         return False
@@ -131,52 +374,118 @@ def _is_card_shaped(pts: np.ndarray, img_h: int, img_w: int) -> bool:
     if not (portrait_ok or landscape_ok):
         return False
 
-    quad_area = cv2.contourArea(pts.reshape(4, 1, 2).astype(np.float32))
+    # Shoelace area of the ordered quad (what cv2.contourArea computes)
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = rect.tolist()
+    quad_area = 0.5 * abs(x0 * y1 - x1 * y0 + x1 * y2 - x2 * y1
+                          + x2 * y3 - x3 * y2 + x3 * y0 - x0 * y3)
     img_area  = img_h * img_w
     return (quad_area / img_area) >= 0.05
 
 
-def _detect_card_quad(gray: np.ndarray, img_h: int, img_w: int) -> np.ndarray | None:
-    """
-    Try three preprocessing strategies (Canny, adaptive threshold, Otsu) to
-    find a card-shaped quadrilateral. Returns the best 4-point float32 array
-    (shape 4×2) sorted by contour area, or None if nothing plausible was found.
-    """
+def _quad_candidates(edged: np.ndarray, img_h: int, img_w: int) -> list[tuple[float, np.ndarray]]:
+    """Return (contour area, 4×2 points) for every card-shaped quad in an edge map."""
     candidates: list[tuple[float, np.ndarray]] = []
-
-    def _try_edges(edged: np.ndarray) -> None:
-        contours, _ = cv2.findContours(edged, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        contours = sorted(contours, key=cv2.contourArea, reverse=True)
-        for cnt in contours[:10]:
-            peri = cv2.arcLength(cnt, True)
-            for eps in (0.01, 0.02, 0.04, 0.06):
-                approx = cv2.approxPolyDP(cnt, eps * peri, True)
-                if len(approx) == 4:
-                    pts = approx.reshape(4, 2).astype(np.float32)
-                    if _is_card_shaped(pts, img_h, img_w):
-                        candidates.append((cv2.contourArea(cnt), pts))
-                    break  # stop trying epsilon values once a quad is found
-
+    contours, _ = cv2.findContours(edged, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    contours = sorted(contours, key=cv2.contourArea, reverse=True)
+    min_area = 0.05 * img_h * img_w
+    for cnt in contours[:10]:
+        # Cheap reject before the epsilon sweep: every approximation's
+        # vertices are contour points, so its area can't exceed that of the
+        # contour's minimum-area rectangle — one under _is_card_shaped's 5%
+        # floor can't yield a big enough quad.  (Its aspect says nothing:
+        # a card with a bump or a stray edge attached has a rectangle of
+        # any shape, yet approxPolyDP may still reduce it to the card.)
+        _, (rw, rh), _ = cv2.minAreaRect(cnt)
+        if rw * rh < min_area:
+            continue
+        peri = cv2.arcLength(cnt, True)
+        for eps in (0.01, 0.02, 0.04, 0.06):
+            approx = cv2.approxPolyDP(cnt, eps * peri, True)
+            if len(approx) == 4:
+                pts = approx.reshape(4, 2).astype(np.float32)
+                if _is_card_shaped(pts, img_h, img_w):
+                    candidates.append((cv2.contourArea(cnt), pts))
+                break  # stop trying epsilon values once a quad is found
+    return candidates
+
+
+def _quads_canny(gray: np.ndarray, blurred: np.ndarray, img_h: int, img_w: int) -> list:
     # Method 1: Canny edges
-    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
     edged = cv2.Canny(blurred, 30, 120)
-    edged = cv2.dilate(edged, None, iterations=1)
-    _try_edges(edged)
+    edged = cv2.dilate(edged, _SE_3x3, iterations=1)
+    return _quad_candidates(edged, img_h, img_w)
+
 
+def _quads_adaptive(gray: np.ndarray, blurred: np.ndarray, img_h: int, img_w: int) -> list:
     # Method 2: Adaptive threshold
+    # Thresholds the shared 5×5 blur rather than a 7×7 blur of its own.  C
+    # was retuned with it (2 → 1): with the lighter blur, C = 2 let noisy
+    # backgrounds pull the detected outline outward.
     thresh = cv2.adaptiveThreshold(
-        cv2.GaussianBlur(gray, (7, 7), 0), 255,
-        cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2,
+        blurred, 255,
+        cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 1,
     )
     thresh = cv2.bitwise_not(thresh)
-    thresh = cv2.dilate(thresh, None, iterations=2)
-    _try_edges(thresh)
+    thresh = cv2.dilate(thresh, _SE_3x3, iterations=2)
+    return _quad_candidates(thresh, img_h, img_w)
+
 
+def _quads_otsu(gray: np.ndarray, blurred: np.ndarray, img_h: int, img_w: int) -> list:
     # Method 3: Otsu threshold
     _, otsu = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
     otsu = cv2.bitwise_not(otsu)
-    otsu = cv2.dilate(otsu, None, iterations=1)
-    _try_edges(otsu)
+    otsu = cv2.dilate(otsu, _SE_3x3, iterations=1)
+    return _quad_candidates(otsu, img_h, img_w)
+
+
+def _detect_card_quad(gray: np.ndarray, img_h: int, img_w: int,
+                      near: np.ndarray | None = None,
+                      tol: float = 0.0) -> np.ndarray | None:
+    """
+    Try three preprocessing strategies (Canny, adaptive threshold, Otsu) to
+    find a card-shaped quadrilateral. Returns the best 4-point float32 array
+    (shape 4×2) sorted by contour area, or None if nothing plausible was found.
+
+    If *near* is given, only quads whose every corner lies within *tol*
+    pixels of the matching corner of *near* are considered.
+
+    Canny runs first, on the calling thread: on a typical scan it already
+    finds the card, and when its best quad covers over half the image with
+    a near-exact card aspect ratio the other two strategies are skipped.
+    Otherwise adaptive threshold and Otsu run concurrently on _QUAD_POOL
+    (OpenCV releases the GIL inside its C++ calls) — except on
+    preprocess_many's worker threads, which run them inline: that pool
+    already keeps every core busy, and funnelling all its images through
+    the shared _QUAD_POOL would leave its workers waiting on two threads.
+    """
+    def _keep(found: list) -> list:
+        if near is None:
+            return found
+        ref = _order_points(near)
+        return [(area, pts) for area, pts in found
+                if np.abs(_order_points(pts) - ref).max() <= tol]
+
+    blurred = cv2.GaussianBlur(gray, (5, 5), 0)   # shared by Canny and Otsu
+    candidates = _keep(_quads_canny(gray, blurred, img_h, img_w))
+    if candidates:
+        best_area, best_pts = max(candidates, key=lambda x: x[0])
+        if _is_confident_quad(best_area, best_pts, img_h, img_w):
+            return best_pts
+
+    # Each strategy keeps its own contour pass.  OR-ing the edge maps into
+    # one findContours does not work: the inverted Otsu / adaptive masks
+    # turn the background into one big foreground blob, and with
+    # RETR_EXTERNAL the card outline becomes a hole inside it and is lost.
+    methods = (_quads_adaptive, _quads_otsu)
+    if getattr(_bulk, "active", False):
+        for method in methods:
+            candidates.extend(_keep(method(gray, blurred, img_h, img_w)))
+    else:
+        futures = [_QUAD_POOL.submit(method, gray, blurred, img_h, img_w)
+                   for method in methods]
+        # Gather in method order so equal-area ties resolve as before
+        for fut in futures:
+            candidates.extend(_keep(fut.result()))
 
     if not candidates:
         return None
@@ -186,11 +495,125 @@ def _detect_card_quad(gray: np.ndarray, img_h: int, img_w: int) -> np.ndarray |
     return candidates[0][1]
 
 
+def _is_confident_quad(area: float, pts: np.ndarray, img_h: int, img_w: int) -> bool:
+    """
+    True when a detected quad is good enough to stop looking: it fills more
+    than half the image and its aspect ratio is within 10% of a card's
+    (portrait or landscape).
+    """
+    if area / (img_h * img_w) <= 0.5:
+        return False
+    w, h = _quad_width_height(_order_points(pts))
+    if w == 0 or h == 0:
+        return False
+    aspect = h / w
+    return (abs(aspect - _CARD_ASPECT) / _CARD_ASPECT < 0.10
+            or abs(aspect - 1.0 / _CARD_ASPECT) * _CARD_ASPECT < 0.10)
+
+
+def _find_card_quad(img_bgr: np.ndarray,
+                    gray: "np.ndarray | None" = None) -> np.ndarray | None:
+    """
+    Locate the card quad in img_bgr without running the full detection over
+    every pixel of a large scan.
+
+    Detection first runs on a greyscale copy downscaled to at most
+    _QUAD_DETECT_MAX_DIM.  That pins down where the card is but not its exact
+    edges — the blur / dilate / adaptive-threshold block sizes are fixed in
+    pixels, so at low resolution they shift the outline outward by several
+    full-resolution pixels.  The quad is therefore re-detected at full
+    resolution inside the card's bounding box plus a margin; if that fails,
+    the scaled-up low-resolution quad is used.  Only full-resolution quads
+    close to the coarse one count — a crop tightly around a card can itself
+    look like a card-shaped outline.  Returns full-resolution coordinates.
+    gray may be passed in when the caller already has it.
+    """
+    h, w = img_bgr.shape[:2]
+    if gray is None:
+        gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
+    scale = _QUAD_DETECT_MAX_DIM / max(h, w)
+    if scale >= 1.0:
+        return _detect_card_quad(gray, h, w)
+
+    small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    sh, sw = small.shape[:2]
+    quad = _detect_card_quad(small, sh, sw)
+    if quad is None:
+        return None
+    quad = quad * np.array([w / sw, h / sh], dtype=np.float32)
+
+    # Refine at full resolution within the region the coarse pass found
+    x0, y0 = quad.min(axis=0)
+    x1, y1 = quad.max(axis=0)
+    margin = int(0.05 * max(x1 - x0, y1 - y0)) + 16
+    x0, y0 = max(0, int(x0) - margin), max(0, int(y0) - margin)
+    x1, y1 = min(w, int(x1) + margin + 1), min(h, int(y1) + margin + 1)
+    offset = np.array([x0, y0], dtype=np.float32)
+    fine = _detect_card_quad(gray[y0:y1, x0:x1], y1 - y0, x1 - x0,
+                             near=quad - offset, tol=margin / 2)
+    if fine is None:
+        return quad
+    return fine + offset
+
+
+def _extract_card(img_bgr: np.ndarray) -> np.ndarray:
+    """
+    Card region of a scan at HASH_IMAGE_SIZE: perspective warp of the
+    detected card quad, or a centre-crop when no quad is found.
+    """
+    global _cuda_enabled
+    if _use_cuda():
+        try:
+            return _extract_card_cuda(img_bgr)
+        except cv2.error:
+            # Driver / build problem — stay on the CPU from now on
+            _cuda_enabled = False
+
+    quad = _find_card_quad(img_bgr)
+    if quad is not None:
+        warped = _four_point_transform(img_bgr, quad)
+        if warped is not None:
+            return _resize_to(warped, HASH_IMAGE_SIZE)
+    return _center_crop_to_card(img_bgr, HASH_IMAGE_SIZE)
+
+
+def _extract_card_cuda(img_bgr: np.ndarray) -> np.ndarray:
+    """
+    _extract_card with the full-resolution pixel work on the GPU.
+
+    The scan is uploaded once; the greyscale conversion, perspective warp
+    and final resize run on the device and only the grey plane (needed by
+    the contour search, which has no CUDA counterpart) and the small card
+    crop are downloaded.
+    """
+    gpu_bgr = cv2.cuda_GpuMat()
+    gpu_bgr.upload(img_bgr)
+    gray = cv2.cuda.cvtColor(gpu_bgr, cv2.COLOR_BGR2GRAY).download()
+
+    quad = _find_card_quad(img_bgr, gray)
+    geometry = _warp_geometry(quad) if quad is not None else None
+    if geometry is None:
+        return _center_crop_to_card(img_bgr, HASH_IMAGE_SIZE)
+
+    M, (ww, wh) = geometry
+    warped = cv2.cuda.warpPerspective(gpu_bgr, M, (ww, wh))
+    shrinking = ww >= HASH_IMAGE_SIZE[0] and wh >= HASH_IMAGE_SIZE[1]
+    card = cv2.cuda.resize(warped, HASH_IMAGE_SIZE,
+                           interpolation=cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR)
+    return card.download()
+
+
 def _center_crop_to_card(img_bgr: np.ndarray, target_size: tuple[int, int]) -> np.ndarray:
     """
-    Centre-crop img_bgr to card aspect ratio, then resize to target_size.
-    target_size is (width, height) as expected by cv2.resize.
+    Centre-crop img_bgr to card aspect ratio, then resize to target_size
+    (see _resize_to).  target_size is (width, height) as expected by
+    cv2.resize.
     """
+    return _resize_to(_crop_to_card_aspect(img_bgr), target_size)
+
+
+def _crop_to_card_aspect(img_bgr: np.ndarray) -> np.ndarray:
+    """Centre crop (a view) of img_bgr with the card's aspect ratio."""
     h, w = img_bgr.shape[:2]
     card_asp = _CARD_ASPECT  # height / width
 
@@ -205,7 +628,54 @@ def _center_crop_to_card(img_bgr: np.ndarray, target_size: tuple[int, int]) -> n
         x0 = (w - crop_w) // 2
         cropped = img_bgr[:, x0: x0 + crop_w]
 
-    return cv2.resize(cropped, target_size)
+    return cropped
+
+
+def _resize_to(img: np.ndarray, target_size: tuple[int, int]) -> np.ndarray:
+    """
+    cv2.resize to target_size (width, height), picking the interpolation by
+    direction: INTER_AREA when shrinking (box-filter average — faster on
+    OpenCV's SIMD path and alias-free, so hashes are steadier), INTER_LINEAR
+    when enlarging.  Hash path only: the embedding crop stays on plain
+    INTER_LINEAR (see _embedding_card_bgr).
+    """
+    h, w = img.shape[:2]
+    shrinking = w >= target_size[0] and h >= target_size[1]
+    return cv2.resize(img, target_size,
+                      interpolation=cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR)
+
+
+def _embedding_card_bgr(image_path: str,
+                        sticker_mask_px: "tuple | None" = None,
+                        auto_detect: "bool | None" = None) -> np.ndarray:
+    """Centre-crop, sticker-clean and CLAHE a scan for embedding — (S, S, 3) uint8 BGR."""
+    from identifier.sticker import detect_sticker, inpaint_sticker, mask_from_rect
+
+    _auto = auto_detect if auto_detect is not None else STICKER_AUTO_DETECT
+
+    img_bgr = _imread(image_path)
+
+    # ── Manual mask: inpaint on full scan BEFORE centre-crop ─────────────────
+    if sticker_mask_px is not None:
+        ih, iw = img_bgr.shape[:2]
+        manual_mask = mask_from_rect(ih, iw, sticker_mask_px)
+        img_bgr = inpaint_sticker(img_bgr, manual_mask, STICKER_INPAINT_RADIUS)
+
+    size = EMBEDDING_INPUT_SIZE   # 518 for DINOv2, 224 for EfficientNet-B0
+    # Plain INTER_LINEAR, not _resize_to's INTER_AREA: the stored reference
+    # embeddings were computed this way, and the query crops must match them
+    card_bgr = cv2.resize(_crop_to_card_aspect(img_bgr), (size, size),
+                          interpolation=cv2.INTER_LINEAR)
+
+    # ── Auto-detect: runs on the extracted card crop (no manual mask set) ─────
+    if sticker_mask_px is None and _auto:
+        auto_mask = detect_sticker(card_bgr)
+        if auto_mask is not None:
+            card_bgr = inpaint_sticker(card_bgr, auto_mask, STICKER_INPAINT_RADIUS)
+
+    # ── CLAHE: normalize brightness/contrast for aged/yellowed cards ────────────
+    # LAB, not _apply_clahe's YCrCb: must match the stored embeddings
+    return _apply_clahe_lab(card_bgr)
 
 
 # ── Public API ────────────────────────────────────────────────────────────────
@@ -219,22 +689,7 @@ def preprocess_to_card_image(image_path: str) -> np.ndarray:
     hashes.  Used by the GUI to display the card crop in the sticker-mask
     dialog so the user can draw a mask in card-image coordinates.
     """
-    img_bgr = cv2.imread(str(image_path))
-    if img_bgr is None:
-        raise ValueError(f"Cannot read image: {image_path}")
-
-    h, w = img_bgr.shape[:2]
-    gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
-    quad = _detect_card_quad(gray, h, w)
-
-    if quad is not None:
-        warped = _four_point_transform(img_bgr, quad)
-        return (
-            cv2.resize(warped, HASH_IMAGE_SIZE)
-            if warped is not None
-            else _center_crop_to_card(img_bgr, HASH_IMAGE_SIZE)
-        )
-    return _center_crop_to_card(img_bgr, HASH_IMAGE_SIZE)
+    return _extract_card(_imread(image_path))
 
 
 def preprocess_for_hashing(image_path: str,
@@ -263,9 +718,7 @@ def preprocess_for_hashing(image_path: str,
 
     _auto = auto_detect if auto_detect is not None else STICKER_AUTO_DETECT
 
-    img_bgr = cv2.imread(str(image_path))
-    if img_bgr is None:
-        raise ValueError(f"Cannot read image: {image_path}")
+    img_bgr = _imread(image_path)
 
     # ── Manual mask: inpaint on full scan BEFORE card extraction ─────────────
     # sticker_mask_px is in original scan pixel coordinates.
@@ -275,19 +728,7 @@ def preprocess_for_hashing(image_path: str,
         img_bgr = inpaint_sticker(img_bgr, manual_mask, STICKER_INPAINT_RADIUS)
 
     # Card extraction
-    h, w = img_bgr.shape[:2]
-    gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
-    quad = _detect_card_quad(gray, h, w)
-
-    if quad is not None:
-        warped = _four_point_transform(img_bgr, quad)
-        card_bgr = (
-            cv2.resize(warped, HASH_IMAGE_SIZE)
-            if warped is not None
-            else _center_crop_to_card(img_bgr, HASH_IMAGE_SIZE)
-        )
-    else:
-        card_bgr = _center_crop_to_card(img_bgr, HASH_IMAGE_SIZE)
+    card_bgr = _extract_card(img_bgr)
 
     # ── Auto-detect: runs on the extracted card crop (no manual mask set) ─────
     if sticker_mask_px is None and _auto:
@@ -331,36 +772,98 @@ def preprocess_for_embedding(image_path: str,
         Whether to run automatic sticker detection.  None → use the
         STICKER_AUTO_DETECT config constant.
     """
-    from identifier.sticker import detect_sticker, inpaint_sticker, mask_from_rect
+    return _normalize_to_chw(
+        _embedding_card_bgr(image_path, sticker_mask_px, auto_detect)
+    )                                                  # (3, S, S)  CHW
 
-    _auto = auto_detect if auto_detect is not None else STICKER_AUTO_DETECT
 
-    img_bgr = cv2.imread(str(image_path))
-    if img_bgr is None:
-        raise ValueError(f"Cannot read image: {image_path}")
+def preprocess_for_embedding_batch(image_paths: "list[str]",
+                                    out: "np.ndarray | None" = None,
+                                    ) -> "tuple[np.ndarray, list[int]]":
+    """
+    Batched preprocess_for_embedding for many card images at once.
 
-    # ── Manual mask: inpaint on full scan BEFORE centre-crop ─────────────────
-    if sticker_mask_px is not None:
-        ih, iw = img_bgr.shape[:2]
-        manual_mask = mask_from_rect(ih, iw, sticker_mask_px)
-        img_bgr = inpaint_sticker(img_bgr, manual_mask, STICKER_INPAINT_RADIUS)
+    Each image is normalised straight into its slot of one (N, 3, S, S)
+    float32 array, so there is no per-image tensor to allocate and no
+    np.stack copy before handing the batch to torch.from_numpy().
+    Unreadable images are skipped; successful ones are packed to the front.
 
-    size = EMBEDDING_INPUT_SIZE   # 518 for DINOv2, 224 for EfficientNet-B0
-    card_bgr = _center_crop_to_card(img_bgr, (size, size))
+    Parameters
+    ----------
+    image_paths : list[str]
+        Card image files, no sticker mask (the bulk-embedding case).
+    out : np.ndarray | None
+        Optional (>= N, 3, S, S) float32 C-contiguous buffer to reuse
+        across batches.
+
+    Returns (batch, ok) where batch is ``out[:len(ok)]`` and ok lists the
+    indices into image_paths that were preprocessed successfully.
+    """
+    size = EMBEDDING_INPUT_SIZE
+    if out is None:
+        out = np.empty((len(image_paths), 3, size, size), dtype=np.float32)
 
-    # ── Auto-detect: runs on the extracted card crop (no manual mask set) ─────
-    if sticker_mask_px is None and _auto:
-        auto_mask = detect_sticker(card_bgr)
-        if auto_mask is not None:
-            card_bgr = inpaint_sticker(card_bgr, auto_mask, STICKER_INPAINT_RADIUS)
+    # Decode / crop / CLAHE on worker threads; normalise into place here
+    ok: list[int] = []
+    results = preprocess_many(image_paths, _embedding_card_bgr, skip_errors=True)
+    for i, (_path, card_bgr) in enumerate(results):
+        if card_bgr is None:
+            continue
+        _normalize_to_chw(card_bgr, out=out[len(ok)])
+        ok.append(i)
+    return out[:len(ok)], ok
 
-    # ── CLAHE: normalize brightness/contrast for aged/yellowed cards ────────────
-    card_bgr = _apply_clahe(card_bgr)
 
-    rgb = cv2.cvtColor(card_bgr, cv2.COLOR_BGR2RGB)
+def _mark_bulk_thread() -> None:
+    """ThreadPoolExecutor initializer: _imread on this thread skips the cache."""
+    _bulk.active = True
+
+
+def preprocess_many(image_paths, func, workers: "int | None" = None,
+                    prefetch: int = 8, skip_errors: bool = False):
+    """
+    Apply a per-image preprocess function to many files concurrently.
+
+    Yields (path, func(path)) in input order.  At most *prefetch* images are
+    in flight at once, so memory stays bounded however long the list is,
+    while cv2.imread (I/O) and the OpenCV work (both release the GIL) for
+    upcoming images overlap with the caller consuming the current one.
 
-    # Normalise: scale to [0,1] then apply ImageNet mean/std
-    arr = rgb.astype(np.float32) / 255.0           # (S, S, 3)  HWC
-    arr = (arr - _IMAGENET_MEAN) / _IMAGENET_STD   # (S, S, 3)  HWC
-    arr = arr.transpose(2, 0, 1)                   # (3, S, S)  CHW
-    return arr
+    Parameters
+    ----------
+    func : callable
+        Takes a path, e.g. preprocess_for_hashing or preprocess_for_embedding
+        (wrap in functools.partial to pass sticker options).
+    workers : int | None
+        Thread count; defaults to os.cpu_count().
+    skip_errors : bool
+        If True, an image whose func raises yields (path, None) instead of
+        re-raising the exception at that point of the iteration.
+
+    Images are read straight from disk, not through _imread's cache.
+    """
+    workers = max(1, min(workers or os.cpu_count() or 4, prefetch))
+    paths = iter(image_paths)
+    pending: deque = deque()
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preprocess",
+                              initializer=_mark_bulk_thread)
+    try:
+        for path in paths:
+            pending.append((path, pool.submit(func, path)))
+            if len(pending) >= prefetch:
+                break
+        while pending:
+            path, fut = pending.popleft()
+            nxt = next(paths, pending)   # pending doubles as the end sentinel
+            if nxt is not pending:
+                pending.append((nxt, pool.submit(func, nxt)))
+            try:
+                result = fut.result()
+            except Exception:
+                if not skip_errors:
+                    raise
+                result = None
+            yield path, result
+    finally:
+        # Stop queued work if the caller bails out early
+        pool.shutdown(wait=False, cancel_futures=True)
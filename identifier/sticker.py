@@ -17,10 +17,14 @@ Detection thresholds are in config.py (STICKER_SIZE_MAX, STICKER_COLOR_STD_MAX)
 so they can be tuned without touching this file.
 """
 
+import math
+
 import cv2
 import numpy as np
 from config import STICKER_SIZE_MAX, STICKER_COLOR_STD_MAX
 
+# 3×3 rectangular structuring element for the edge dilation — built once
+_SE_3x3 = np.ones((3, 3), np.uint8)
 
 # ── Auto-detection ─────────────────────────────────────────────────────────────
 
@@ -46,9 +50,18 @@ def detect_sticker(card_bgr: np.ndarray) -> "np.ndarray | None":
     gray  = cv2.cvtColor(card_bgr, cv2.COLOR_BGR2GRAY)
     blur  = cv2.GaussianBlur(gray, (5, 5), 0)
     edges = cv2.Canny(blur, 30, 100)
-    dil   = cv2.dilate(edges, np.ones((3, 3), np.uint8), iterations=1)
+    dil   = cv2.dilate(edges, _SE_3x3, iterations=1)
+
+    # Cheap exit: the outline of even the smallest accepted sticker (1% of the
+    # card, square) is at least 4·√(0.01·area) edge pixels long.  With fewer
+    # edge pixels than that in the whole image no contour can qualify, so
+    # skip findContours and the per-contour loop.
+    if cv2.countNonZero(dil) < 4.0 * math.sqrt(card_area * 0.01):
+        return None
 
     contours, _ = cv2.findContours(dil, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    if not contours:
+        return None
 
     best: "tuple | None" = None
     best_score = 0.0
@@ -78,7 +91,9 @@ def detect_sticker(card_bgr: np.ndarray) -> "np.ndarray | None":
         # Colour uniformity: solid/white stickers have low-to-moderate std dev.
         # STICKER_COLOR_STD_MAX ~90 catches white labels with text (which have
         # ~60–90 std-dev) while still rejecting colourful card-art regions (>100).
-        mean_std = float(np.mean(np.std(roi.reshape(-1, 3).astype(np.float32), axis=0)))
+        # cv2.meanStdDev works on the uint8 ROI view directly — no float copy.
+        _, std = cv2.meanStdDev(roi)
+        mean_std = float(std.mean())
         if mean_std > STICKER_COLOR_STD_MAX:
             continue  # too much colour variation → not a price sticker
 
@@ -3,16 +3,22 @@ LLC Scanner — Installer Build Script
 =====================================
 Automates the full pipeline:
   1. Converts logo PNG -> ICO (installer icon)
-  2. Compiles launcher.py -> launcher.exe via PyInstaller
+  2. Compiles launcher.py -> installer/launcher/ (launcher.exe + _internal/)
+     via PyInstaller
   3. Stages app source files into installer/dist/app/
-  4. Runs Inno Setup compiler (iscc) -> LLC-Scanner-Setup.exe
+  4. Downloads dependency wheels into installer/dist/wheels/ and pins
+     them in wheels/requirements.lock, zips an empty venv template (installer/dist/venv_template.zip) and fetches
+     virtualenv.pyz
+  5. Runs Inno Setup compiler (iscc) -> LLC-Scanner-Setup.exe
 
 Prerequisites (install once):
-  pip install pyinstaller pillow
+  pip install "pyinstaller>=6.6" pillow
   Download Inno Setup 6 from https://jrsoftware.org/isdl.php
 
 Usage:
-  python installer/build_installer.py
+  python installer/build_installer.py            # launcher via PyInstaller
+  python installer/build_installer.py --nuitka   # launcher via Nuitka
+                                                 # (pip install nuitka)
 
 The finished installer will be at:
   installer/dist/LLC-Scanner-Setup.exe
@@ -24,6 +30,7 @@ import stat
 import shutil
 import subprocess
 import winreg
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # ── Paths ──────────────────────────────────────────────────────────────────────
@@ -32,6 +39,11 @@ SCRIPT_DIR  = Path(__file__).parent                   # installer/
 PROJECT_DIR = SCRIPT_DIR.parent                       # project root
 DIST_DIR    = SCRIPT_DIR / "dist"
 APP_STAGE   = DIST_DIR / "app"                        # staged source files
+WHEELS_DIR  = DIST_DIR / "wheels"                     # bundled dependency wheels
+WHEELS_LOCK = WHEELS_DIR / "requirements.lock"        # pinned, hashed closure
+VENV_TEMPLATE = DIST_DIR / "venv_template.zip"        # pre-built empty venv
+VIRTUALENV_PYZ = DIST_DIR / "virtualenv.pyz"          # virtualenv zipapp
+VIRTUALENV_PYZ_URL = "https://bootstrap.pypa.io/virtualenv.pyz"
 LAUNCHER_PY = SCRIPT_DIR / "launcher.py"
 ICON_PNG    = PROJECT_DIR / "gui" / "assets" / "logo_white.png"
 ICON_ICO    = PROJECT_DIR / "gui" / "assets" / "logo.ico"
@@ -91,10 +103,28 @@ def _find_iscc() -> Path | None:
     return None
 
 
+def _run_logged(cmd: list[str], cwd: Path) -> int:
+    """
+    Run a build tool with its output captured instead of streamed.
+
+    PyInstaller and iscc log hundreds of lines per run, and writing them to
+    a Windows console costs noticeable wall time.  The log is only printed
+    when the tool fails.  Returns the exit code.
+    """
+    result = subprocess.run(
+        cmd, cwd=str(cwd),
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, errors="replace",
+    )
+    if result.returncode != 0:
+        print(result.stdout)
+    return result.returncode
+
+
 # ── Step 1: PNG -> ICO ─────────────────────────────────────────────────────────
 
 def build_icon():
-    print("[1/4] Converting logo to .ico ...")
+    print("[1/5] Converting logo to .ico ...")
     try:
         from PIL import Image
     except ImportError:
@@ -106,6 +136,10 @@ def build_icon():
         print(f"  Warning: {ICON_PNG} not found — skipping icon.")
         return
 
+    if ICON_ICO.exists() and ICON_ICO.stat().st_mtime >= ICON_PNG.stat().st_mtime:
+        print(f"  {ICON_ICO.name} up to date — skipping.")
+        return
+
     img = Image.open(ICON_PNG).convert("RGBA")
     # Generate multiple sizes for the .ico multi-resolution format
     sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
@@ -116,12 +150,16 @@ def build_icon():
 # ── Step 2: Compile launcher.exe ──────────────────────────────────────────────
 
 def build_launcher():
-    print("[2/4] Compiling launcher.exe via PyInstaller ...")
+    if "--nuitka" in sys.argv[1:]:
+        build_launcher_nuitka()
+        return
+
+    print("[2/5] Compiling launcher.exe via PyInstaller ...")
 
     icon_arg = str(ICON_ICO) if ICON_ICO.exists() else "NONE"
 
     # Bundle logo assets so the setup window can show the logo image and favicon.
-    # At runtime they are extracted to sys._MEIPASS by PyInstaller.
+    # At runtime they are found under sys._MEIPASS (the _internal/ folder).
     # Only logo_white.png and logo.ico are needed by the launcher itself.
     assets_dir = PROJECT_DIR / "gui" / "assets"
     add_data_args = []
@@ -131,36 +169,97 @@ def build_launcher():
             # --add-data src;dest  (dest is relative inside _MEIPASS)
             add_data_args += ["--add-data", f"{src};assets"]
 
+    # Stdlib packages the launcher never imports — less to ship and install.
+    exclude_args = []
+    for module in ("unittest", "test", "tkinter.test", "pydoc", "pydoc_data",
+                   "xml", "html", "http", "email"):
+        exclude_args += ["--exclude-module", module]
+
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--onefile",
+        # One folder rather than --onefile: a onefile exe unpacks its whole
+        # archive to a fresh temp dir on *every* launch.  Installed as a
+        # folder, each launch is a plain exec.
+        "--onedir",
+        "--optimize", "2",      # strip asserts and docstrings from the bytecode
         "--windowed",           # no console window
         "--name", "launcher",
-        "--distpath", str(SCRIPT_DIR),   # put launcher.exe in installer/
+        "--noconfirm",
+        "--distpath", str(SCRIPT_DIR),   # -> installer/launcher/
+        # Kept between runs (stage_app only clears dist/app) and no --clean,
+        # so later builds reuse PyInstaller's analysis cache.
         "--workpath", str(DIST_DIR / "pyinstaller_build"),
         "--specpath", str(DIST_DIR),
         "--icon", icon_arg,
         *add_data_args,
+        *exclude_args,
         str(LAUNCHER_PY),
     ]
 
-    result = subprocess.run(cmd, cwd=str(PROJECT_DIR))
-    if result.returncode != 0:
+    if _run_logged(cmd, PROJECT_DIR) != 0:
         print("  ERROR: PyInstaller failed. See output above.")
         sys.exit(1)
 
-    launcher_exe = SCRIPT_DIR / "launcher.exe"
+    launcher_exe = SCRIPT_DIR / "launcher" / "launcher.exe"
     if not launcher_exe.exists():
         print("  ERROR: launcher.exe not found after PyInstaller build.")
         sys.exit(1)
 
-    print(f"  -> {launcher_exe}  ({launcher_exe.stat().st_size // 1024} KB)")
+    size_kb = sum(f.stat().st_size for f in launcher_exe.parent.rglob("*") if f.is_file()) // 1024
+    print(f"  -> {launcher_exe.parent}  ({size_kb} KB)")
+
+
+def build_launcher_nuitka():
+    """
+    Alternative to the PyInstaller build: Nuitka compiles the launcher to C
+    and links a standalone folder (no bytecode archive to unpack or
+    interpret at startup).  Produces the same installer/launcher/ layout,
+    so the rest of the pipeline is unchanged.
+    """
+    print("[2/5] Compiling launcher.exe via Nuitka ...")
+
+    build_dir = DIST_DIR / "nuitka_build"
+    cmd = [
+        sys.executable, "-m", "nuitka",
+        "--standalone",                     # a folder, like --onedir above
+        "--windows-console-mode=disable",
+        "--enable-plugin=tk-inter",
+        "--output-dir", str(build_dir),
+        "--output-filename", "launcher.exe",
+        "--assume-yes-for-downloads",       # C compiler / dependency walker
+    ]
+    if ICON_ICO.exists():
+        cmd += ["--windows-icon-from-ico", str(ICON_ICO)]
+    # Same assets as the PyInstaller build; found via __file__'s folder
+    assets_dir = PROJECT_DIR / "gui" / "assets"
+    for asset in ("logo_white.png", "logo.ico"):
+        src = assets_dir / asset
+        if src.exists():
+            cmd += [f"--include-data-files={src}=assets/{asset}"]
+    cmd.append(str(LAUNCHER_PY))
+
+    if _run_logged(cmd, PROJECT_DIR) != 0:
+        print("  ERROR: Nuitka failed. See output above.")
+        sys.exit(1)
+
+    out_dir = SCRIPT_DIR / "launcher"
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    shutil.copytree(build_dir / f"{LAUNCHER_PY.stem}.dist", out_dir)
+
+    launcher_exe = out_dir / "launcher.exe"
+    if not launcher_exe.exists():
+        print("  ERROR: launcher.exe not found after Nuitka build.")
+        sys.exit(1)
+
+    size_kb = sum(f.stat().st_size for f in out_dir.rglob("*") if f.is_file()) // 1024
+    print(f"  -> {out_dir}  ({size_kb} KB)")
 
 
 # ── Step 3: Stage app files ───────────────────────────────────────────────────
 
 def stage_app():
-    print("[3/4] Staging app source files ...")
+    print("[3/5] Staging app source files ...")
 
     if APP_STAGE.exists():
         def _force_remove(func, path, exc_info):
@@ -170,33 +269,202 @@ def stage_app():
         shutil.rmtree(APP_STAGE, onerror=_force_remove)
     APP_STAGE.mkdir(parents=True)
 
-    for fname in APP_FILES:
-        src = PROJECT_DIR / fname
-        if src.exists():
-            shutil.copy2(src, APP_STAGE / fname)
-            print(f"  + {fname}")
+    # Copies are dominated by per-file open/close latency (worse on OneDrive-
+    # synced trees), not bandwidth, so run the files and trees concurrently.
+    # Results are reported afterwards in list order.
+    ignore = shutil.ignore_patterns("__pycache__", "*.pyc", "*.pyo")
+    jobs = []   # (label, future | None)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for fname in APP_FILES:
+            src = PROJECT_DIR / fname
+            if src.exists():
+                jobs.append((fname, pool.submit(shutil.copy2, src, APP_STAGE / fname)))
+            else:
+                jobs.append((fname, None))
+        for dname in APP_DIRS:
+            src = PROJECT_DIR / dname
+            if src.exists():
+                fut = pool.submit(shutil.copytree, src, APP_STAGE / dname, ignore=ignore)
+                jobs.append((f"{dname}/", fut))
+            else:
+                jobs.append((f"{dname}/", None))
+
+    for label, fut in jobs:
+        if fut is None:
+            print(f"  WARNING: {label} not found, skipping.")
         else:
-            print(f"  WARNING: {fname} not found, skipping.")
-
-    for dname in APP_DIRS:
-        src = PROJECT_DIR / dname
-        if src.exists():
-            dst = APP_STAGE / dname
-            shutil.copytree(
-                src, dst,
-                ignore=shutil.ignore_patterns("__pycache__", "*.pyc", "*.pyo"),
-            )
-            print(f"  + {dname}/")
-        else:
-            print(f"  WARNING: {dname}/ not found, skipping.")
+            fut.result()   # re-raise any copy error
+            print(f"  + {label}")
 
     print(f"  -> Staged to {APP_STAGE}")
 
 
-# ── Step 4: Run Inno Setup ────────────────────────────────────────────────────
+# ── Step 4: Offline setup files (wheels + venv template) ──────────────────────
+
+def download_wheels():
+    print("[4/5] Downloading dependency wheels ...")
+
+    # Binary wheels for the Python 3.11 the installer ships, so first-run
+    # setup can pip install with --no-index.  The folder is kept between
+    # builds; pip download skips files that are already there.
+    cmd = [
+        sys.executable, "-m", "pip", "download",
+        "-r", str(PROJECT_DIR / "requirements.txt"),
+        # pip itself too: the launcher can run it straight from the wheel
+        # into a venv created --without-pip (no ensurepip)
+        "pip",
+        "--dest", str(WHEELS_DIR),
+        "--only-binary=:all:",
+        "--platform", "win_amd64",
+        "--python-version", "3.11",
+        "--disable-pip-version-check",
+    ]
+    if _run_logged(cmd, PROJECT_DIR) != 0:
+        # Not fatal: without wheels the launcher installs from PyPI
+        print("  WARNING: pip download failed — installer will fetch packages online.")
+        WHEELS_LOCK.unlink(missing_ok=True)
+        return
+
+    wheels = list(WHEELS_DIR.glob("*.whl"))
+    size_mb = sum(w.stat().st_size for w in wheels) / (1024 * 1024)
+    print(f"  -> {WHEELS_DIR}  ({len(wheels)} wheels, {size_mb:.0f} MB)")
+    lock_requirements()
+
+
+def lock_requirements():
+    """
+    Resolve requirements.txt once, here, against the downloaded wheels and
+    write the result as a hash-pinned lockfile.
+
+    The launcher installs from it with --no-deps --require-hashes, so pip on
+    the user's machine just verifies and unpacks each wheel instead of
+    running its backtracking resolver.  The wheels folder is kept between
+    builds and may hold stale versions; the dry-run resolve picks exactly
+    the set requirements.txt needs now.
+    """
+    import json
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report = Path(tmp) / "report.json"
+        cmd = [
+            sys.executable, "-m", "pip", "install",
+            "-r", str(PROJECT_DIR / "requirements.txt"),
+            "--dry-run", "--ignore-installed", "--quiet",
+            "--report", str(report),
+            "--no-index", "--find-links", str(WHEELS_DIR),
+            "--only-binary=:all:",
+            "--platform", "win_amd64",
+            "--python-version", "3.11",
+            "--target", str(Path(tmp) / "target"),
+            "--disable-pip-version-check",
+        ]
+        if _run_logged(cmd, PROJECT_DIR) != 0:
+            # Not fatal: the launcher resolves requirements.txt itself
+            print("  WARNING: could not resolve the wheels — no lockfile written.")
+            WHEELS_LOCK.unlink(missing_ok=True)
+            return
+        items = json.loads(report.read_text(encoding="utf-8"))["install"]
+
+    lines = []
+    for item in sorted(items, key=lambda i: i["metadata"]["name"].lower()):
+        meta = item["metadata"]
+        digest = _wheel_sha256(item)
+        if digest is None:
+            print(f"  ERROR: no sha256 for {meta['name']}=={meta['version']} "
+                  f"in pip's report, and its wheel could not be read.")
+            sys.exit(1)
+        lines.append(f"{meta['name']}=={meta['version']} --hash=sha256:{digest}")
+    WHEELS_LOCK.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    print(f"  -> {WHEELS_LOCK}  ({len(lines)} pinned)")
+
+
+def _wheel_sha256(item: dict) -> "str | None":
+    """
+    sha256 of one entry of pip's --report "install" list.
+
+    Newer pips give archive_info.hashes.sha256; older ones only the legacy
+    archive_info.hash ("sha256=<hex>").  Failing both, hash the wheel that
+    download_info.url points at (a file:// URL into WHEELS_DIR).
+    """
+    import hashlib
+    from urllib.parse import urlparse
+    from urllib.request import url2pathname
+
+    info = item.get("download_info") or {}
+    archive = info.get("archive_info") or {}
+    digest = (archive.get("hashes") or {}).get("sha256")
+    if digest:
+        return digest
+    algo, _, legacy = (archive.get("hash") or "").partition("=")
+    if algo == "sha256" and legacy:
+        return legacy
+
+    url = urlparse(info.get("url") or "")
+    if url.scheme != "file":
+        return None
+    try:
+        data = Path(url2pathname(url.path)).read_bytes()
+    except OSError:
+        return None
+    return hashlib.sha256(data).hexdigest()
+
+
+def build_venv_template():
+    """
+    Zip an empty venv (pip included) for the launcher to extract on first
+    run instead of running `python -m venv`.  The launcher only uses it when
+    the user's Python has the same major.minor as this one.
+    """
+    import tempfile
+    import zipfile
+
+    if sys.version_info[:2] != (3, 11):
+        print(f"  Note: building venv template with Python "
+              f"{sys.version_info.major}.{sys.version_info.minor}; the bundled "
+              f"Python 3.11 won't use it.")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        venv_dir = Path(tmp) / "venv"
+        if _run_logged([sys.executable, "-m", "venv", str(venv_dir)], PROJECT_DIR) != 0:
+            print("  WARNING: venv template not built — launcher will run python -m venv.")
+            return
+        tmp_zip = VENV_TEMPLATE.with_suffix(".tmp")
+        with zipfile.ZipFile(tmp_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+            for path in sorted(venv_dir.rglob("*")):
+                if path.is_file() and path.suffix != ".pyc":
+                    zf.write(path, path.relative_to(venv_dir).as_posix())
+        os.replace(tmp_zip, VENV_TEMPLATE)
+
+    print(f"  -> {VENV_TEMPLATE}  ({VENV_TEMPLATE.stat().st_size // 1024} KB)")
+
+
+def fetch_virtualenv_pyz():
+    """
+    Download virtualenv's zipapp (kept between builds).  The launcher uses
+    it when the venv template doesn't match the user's Python — it seeds
+    pip from a cached wheel instead of running ensurepip, and runs straight
+    from the .pyz without being installed into that Python.
+    """
+    if VIRTUALENV_PYZ.exists():
+        print(f"  {VIRTUALENV_PYZ.name} present — skipping download.")
+        return
+    import urllib.request
+    tmp = VIRTUALENV_PYZ.with_suffix(".tmp")
+    try:
+        urllib.request.urlretrieve(VIRTUALENV_PYZ_URL, tmp)
+        os.replace(tmp, VIRTUALENV_PYZ)
+    except OSError as exc:
+        print(f"  WARNING: could not download virtualenv.pyz ({exc}) — "
+              f"launcher will fall back to python -m venv.")
+        return
+    print(f"  -> {VIRTUALENV_PYZ}  ({VIRTUALENV_PYZ.stat().st_size // 1024} KB)")
+
+
+# ── Step 5: Run Inno Setup ────────────────────────────────────────────────────
 
 def build_setup():
-    print("[4/4] Building installer with Inno Setup ...")
+    print("[5/5] Building installer with Inno Setup ...")
 
     # Check redist folder has Python installer
     redist_files = list(REDIST_DIR.glob("python-3.11*.exe")) if REDIST_DIR.exists() else []
@@ -224,8 +492,7 @@ def build_setup():
 
     print(f"  Inno Setup found: {iscc}")
     iss_file = SCRIPT_DIR / "installer.iss"
-    result = subprocess.run([str(iscc), str(iss_file)], cwd=str(SCRIPT_DIR))
-    if result.returncode != 0:
+    if _run_logged([str(iscc), str(iss_file)], SCRIPT_DIR) != 0:
         print("  ERROR: Inno Setup failed. See output above.")
         sys.exit(1)
 
@@ -257,6 +524,10 @@ def main():
     print()
     stage_app()
     print()
+    download_wheels()
+    build_venv_template()
+    fetch_virtualenv_pyz()
+    print()
     build_setup()
     print()
     print("=" * 60)
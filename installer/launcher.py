@@ -1,37 +1,62 @@
 """
 LLC Scanner — Launcher / First-Run Bootstrapper
 
-This script is compiled into a small launcher.exe by PyInstaller.
+This script is compiled into launcher.exe (one-folder build) by PyInstaller,
+or optionally Nuitka (build_installer.py --nuitka).
 On first launch it installs dependencies into a venv, then starts the app.
 On subsequent launches it just starts the app directly.
 
 The compiled launcher.exe is placed at the root of the install directory
 by the Inno Setup installer. It expects:
     {install_dir}/
-        launcher.exe        ← this script, compiled
+        launcher.exe        ← this script (+ setup_window.py), compiled
+        _internal/          ← its PyInstaller runtime
         main.py
         requirements.txt
         config.py
         cards/  db/  ebay/  gui/  identifier/
+        wheels/             ← pre-downloaded dependency wheels (optional)
+            requirements.lock   ← their pinned, hashed closure
+        venv_template.zip   ← pre-built empty venv (optional)
+        virtualenv.pyz      ← virtualenv zipapp (optional)
 """
 
 import os
 import sys
 import subprocess
-import tkinter as tk
-from tkinter import ttk
 from pathlib import Path
 import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from setup_window import SetupWindow
 
 
 # ── Paths ──────────────────────────────────────────────────────────────────────
 
-# When compiled by PyInstaller --onefile, sys.executable is launcher.exe itself.
-# The app files are installed alongside it.
-APP_DIR  = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).parent.parent
+# When compiled (PyInstaller sets sys.frozen, Nuitka defines __compiled__),
+# sys.executable is launcher.exe itself.  The app files are installed
+# alongside it.
+_COMPILED = getattr(sys, "frozen", False) or "__compiled__" in globals()
+APP_DIR  = Path(sys.executable).parent if _COMPILED else Path(__file__).parent.parent
 VENV_DIR = APP_DIR / ".venv"
 MAIN_PY  = APP_DIR / "main.py"
 REQS     = APP_DIR / "requirements.txt"
+# Wheels downloaded at build time (build_installer.py) so first-run setup can
+# install without touching PyPI.  Absent in a source checkout.
+WHEELS_DIR = APP_DIR / "wheels"
+# requirements.txt resolved against those wheels at build time, exact
+# versions with hashes — installing it needs no dependency resolution.
+WHEELS_LOCK = WHEELS_DIR / "requirements.lock"
+# Empty venv (pip included) zipped at build time; extracting it is much
+# faster than `python -m venv`, which spends most of its time in ensurepip.
+VENV_TEMPLATE = APP_DIR / "venv_template.zip"
+# virtualenv's self-contained zipapp, for when the template doesn't match the
+# local Python: it seeds pip from a cached, pre-extracted wheel instead of
+# running ensurepip.
+VIRTUALENV_PYZ = APP_DIR / "virtualenv.pyz"
+# Per-user data that outlives the install directory (venv cache, etc.)
+USER_CACHE_DIR = Path(os.getenv("LOCALAPPDATA") or Path.home() / ".cache") / "LLCScanner"
 
 # Python inside the venv created during first-run install
 if sys.platform == "win32":
@@ -42,98 +67,41 @@ else:
 
 # ── First-run detection ────────────────────────────────────────────────────────
 
-def _needs_setup() -> bool:
-    """Return True if the venv hasn't been created yet."""
-    return not VENV_PYTHON.exists()
-
+# Digest of the requirements.txt the venv was last installed from
+REQS_STAMP = VENV_DIR / ".reqs.sha256"
 
-# ── Progress window ────────────────────────────────────────────────────────────
 
-class SetupWindow(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("LLC Scanner - First-Time Setup")
-        self.resizable(False, False)
-        self.configure(bg="#1a1a2e")
+def _reqs_digest() -> str:
+    """SHA-256 of requirements.txt (hex)."""
+    import hashlib
+    return hashlib.sha256(REQS.read_bytes()).hexdigest()
 
-        # ── Icons (favicon + logo image) ──────────────────────────────────────
-        # Assets are bundled into the PyInstaller _MEIPASS temp folder.
-        _assets = Path(getattr(sys, "_MEIPASS", Path(__file__).parent)) / "assets"
 
-        # Favicon / taskbar icon
-        try:
-            _ico = _assets / "logo.ico"
-            if _ico.exists():
-                self.iconbitmap(default=str(_ico))
-        except Exception:
-            pass
+def _needs_setup() -> bool:
+    """
+    Return True if the venv hasn't been created yet, or was installed from
+    a different requirements.txt (an app update changed the dependencies).
+    """
+    if not VENV_PYTHON.exists():
+        return True
+    # Without a readable requirements.txt there is nothing to compare
+    # against — reinstalling wouldn't help (setup would fail the same way)
+    # and would loop on every launch, so keep the venv we have.
+    try:
+        current = _reqs_digest()
+    except OSError as e:
+        _log(f"requirements.txt unreadable ({e}); keeping existing venv")
+        return False
+    try:
+        return REQS_STAMP.read_text(encoding="utf-8").strip() != current
+    except OSError:
+        return True     # no stamp: venv predates the stamp, or setup died
 
-        # Logo image displayed above the title text.
-        # Use tk.PhotoImage directly (supports PNG natively in Tk 8.6+)
-        # so we don't need Pillow bundled into the launcher exe.
-        self._logo_photo = None  # keep reference to prevent GC
-        try:
-            _png = _assets / "logo_white.png"
-            if _png.exists():
-                self._logo_photo = tk.PhotoImage(file=str(_png))
-                # Scale down to ~64px using Tk's subsample (image is likely 512px+)
-                w = self._logo_photo.width()
-                factor = max(1, w // 64)
-                self._logo_photo = self._logo_photo.subsample(factor, factor)
-        except Exception:
-            pass
 
-        # Centre on screen — do after icon so geometry is correct
-        self.update_idletasks()
-        w, h = 460, 220
-        x = (self.winfo_screenwidth()  - w) // 2
-        y = (self.winfo_screenheight() - h) // 2
-        self.geometry(f"{w}x{h}+{x}+{y}")
-
-        # Prevent closing during install
-        self.protocol("WM_DELETE_WINDOW", lambda: None)
-
-        # Logo image (if loaded)
-        if self._logo_photo:
-            tk.Label(self, image=self._logo_photo,
-                     bg="#1a1a2e").pack(pady=(18, 4))
-        else:
-            tk.Frame(self, height=18, bg="#1a1a2e").pack()  # spacing fallback
-
-        tk.Label(
-            self, text="LLC Scanner", bg="#1a1a2e", fg="#e0e0e0",
-            font=("Helvetica", 16, "bold"),
-        ).pack(pady=(0, 4))
-
-        self._status = tk.StringVar(value="Installing dependencies...")
-        tk.Label(
-            self, textvariable=self._status, bg="#1a1a2e", fg="#a0a0b0",
-            font=("Helvetica", 10),
-        ).pack(pady=(0, 12))
-
-        self._bar = ttk.Progressbar(self, mode="indeterminate", length=380)
-        self._bar.pack(pady=(0, 8))
-        self._bar.start(12)
-
-        self._detail = tk.StringVar(value="")
-        tk.Label(
-            self, textvariable=self._detail, bg="#1a1a2e", fg="#606080",
-            font=("Helvetica", 8),
-        ).pack()
-
-    def set_status(self, msg: str):
-        self.after(0, lambda: self._status.set(msg))
-
-    def set_detail(self, msg: str):
-        # Truncate long lines so the window doesn't resize
-        if len(msg) > 70:
-            msg = "..." + msg[-67:]
-        self.after(0, lambda: self._detail.set(msg))
-
-    def finish(self):
-        """Stop progress bar and allow close."""
-        self.after(0, self._bar.stop)
-        self.after(0, lambda: self.protocol("WM_DELETE_WINDOW", self.destroy))
+def _log(msg: str) -> None:
+    """Best-effort diagnostic line (sys.stderr is None in the windowed exe)."""
+    if sys.stderr is not None:
+        print(f"[launcher] {msg}", file=sys.stderr)
 
 
 # ── Install logic ──────────────────────────────────────────────────────────────
@@ -153,33 +121,92 @@ def _check_python_version(cmd: str) -> bool:
     return False
 
 
+def _find_python_via_registry() -> str | None:
+    """
+    Newest registered CPython 3.11+ (PEP 514 PythonCore keys, per-user and
+    machine-wide), found without starting an interpreter.  None off Windows
+    or when nothing suitable is registered.
+    """
+    if sys.platform != "win32":
+        return None
+    import winreg
+
+    found: list[tuple[tuple[int, int], str]] = []
+    for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            core = winreg.OpenKey(hive, r"Software\Python\PythonCore")
+        except OSError:
+            continue
+        with core:
+            i = 0
+            while True:
+                try:
+                    tag = winreg.EnumKey(core, i)
+                except OSError:
+                    break
+                i += 1
+                # Plain "3.12" tags only — skips 32-bit ("3.12-32") and
+                # free-threaded ("3.13t") builds
+                major, _, minor = tag.partition(".")
+                if not (major.isdigit() and minor.isdigit()):
+                    continue
+                version = (int(major), int(minor))
+                if version[0] != 3 or version < (3, 11):
+                    continue
+                try:
+                    with winreg.OpenKey(core, rf"{tag}\InstallPath") as key:
+                        install_dir, _ = winreg.QueryValueEx(key, "")
+                except OSError:
+                    continue
+                exe = Path(install_dir) / "python.exe"
+                if exe.exists():
+                    found.append((version, str(exe)))
+
+    return max(found)[1] if found else None
+
+
 def _find_system_python() -> str | None:
     """Find a Python 3.11+ interpreter.
 
     Search order:
+      0. The newest Python 3.11+ registered in the Windows registry — a stat
+         per candidate instead of an interpreter start; includes both the
+         user's own install and the one the LLC Scanner installer adds
       1. Any Python 3.11+ already on the system PATH (respects user's own install)
       2. Per-user Python 3.11 installed by the LLC Scanner installer
          (%LocalAppData%\\Programs\\Python\\Python311\\python.exe)
          — only reached if the user had no existing Python 3.11+
     """
+    registered = _find_python_via_registry()
+    if registered is not None:
+        return registered
+
     # Priority 1: system PATH — covers Python 3.11, 3.12, 3.13, etc.
     # If the user already has a newer Python we should use it, not override it.
-    for candidate in ("python", "python3", "py"):
-        if _check_python_version(candidate):
-            return candidate
+    candidates = ["python", "python3", "py"]
 
     # Priority 2: fallback to the bundled Python 3.11 installed by the LLC Scanner
     # installer (InstallAllUsers=0, PrependPath=0 — so it won't be on PATH)
     if sys.platform == "win32":
         local_app = os.getenv("LOCALAPPDATA", "")
         bundled = Path(local_app) / "Programs" / "Python" / "Python311" / "python.exe"
-        if bundled.exists() and _check_python_version(str(bundled)):
-            return str(bundled)
+        if bundled.exists():
+            candidates.append(str(bundled))
+
+    # Each probe is an interpreter cold start (and a missing command can be
+    # slow to fail), so run them all at once and take the results in
+    # priority order: discovery costs the slowest probe, not the sum.
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+        results = list(pool.map(_check_python_version, candidates))
+    for candidate, ok in zip(candidates, results):
+        if ok:
+            return candidate
 
     return None
 
 
-def _show_error_and_close(window: SetupWindow, title: str, message: str):
+def _show_error_and_close(window: "SetupWindow", title: str, message: str):
     """Show a blocking error dialog on the main thread, then close the window."""
     from tkinter import messagebox
     def _do():
@@ -189,31 +216,230 @@ def _show_error_and_close(window: SetupWindow, title: str, message: str):
     window.after(0, _do)
 
 
-def _run_setup(window: SetupWindow):
-    """Run in a background thread: create venv + pip install."""
-    # Ensure all subprocesses run in UTF-8 mode
-    os.environ["PYTHONUTF8"] = "1"
+def _extract_venv_archive(archive: Path, python_cmd: str) -> bool:
+    """
+    Create VENV_DIR from a zipped venv (VENV_TEMPLATE or a cached install),
+    pointed at python_cmd's interpreter.
+
+    Only used when the archive was built with the same major.minor Python.
+    pyvenv.cfg is rewritten to the local interpreter; the archive's
+    Scripts/*.exe entry points may still name another path, which is
+    harmless — the launcher only ever runs `python -m pip` / main.py.
+    Returns False (leaving no partial venv) when the archive is missing,
+    doesn't match, or can't be extracted, so the caller falls back to
+    building the venv.
+    """
+    if not archive.exists():
+        return False
     try:
-        python_cmd = _find_system_python()
-        if python_cmd is None:
-            _show_error_and_close(
-                window,
-                "Setup Failed - Python Not Found",
-                "LLC Scanner could not locate Python 3.11.\n\n"
-                "Please try uninstalling and reinstalling LLC Scanner.\n\n"
-                "If the problem persists, install Python 3.11 manually from:\n"
-                "https://www.python.org/downloads/\n"
-                "(Use the default options when installing.)"
+        probe = subprocess.run(
+            [python_cmd, "-c",
+             "import sys; print(sys.executable); print('%d.%d' % sys.version_info[:2])"],
+            capture_output=True, text=True, timeout=10,
+        )
+        if probe.returncode != 0:
+            return False
+        exe, version = probe.stdout.strip().splitlines()[-2:]
+        exe = Path(exe)
+
+        import zipfile
+        with zipfile.ZipFile(archive) as zf:
+            cfg = zf.read("pyvenv.cfg").decode("utf-8").splitlines()
+            template_version = next(
+                (line.partition("=")[2].strip() for line in cfg
+                 if line.partition("=")[0].strip() in ("version", "version_info")),
+                "",
             )
+            if not template_version.startswith(version + "."):
+                return False
+            zf.extractall(VENV_DIR)
+
+        overrides = {
+            "home": str(exe.parent),
+            "executable": str(exe),
+            "base-executable": str(exe),
+            "command": f"{exe} -m venv {VENV_DIR}",
+        }
+        lines = []
+        for line in cfg:
+            key = line.partition("=")[0].strip()
+            lines.append(f"{key} = {overrides[key]}" if key in overrides else line)
+        (VENV_DIR / "pyvenv.cfg").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return True
+    except Exception:
+        import shutil
+        shutil.rmtree(VENV_DIR, ignore_errors=True)
+        return False
+
+
+# Venvs bigger than this aren't cached — the copy would cost more disk than
+# a reinstall from the bundled wheels costs time
+VENV_CACHE_MAX_BYTES = 3 * 1024 ** 3
+SAVE_CACHE_ARG = "--save-venv-cache"
+
+
+def _cached_venv_path() -> Path:
+    """
+    Archive of a fully installed venv for the current requirements.txt.
+
+    Kept outside the install directory so it survives a repair or an
+    in-place reinstall (the uninstaller removes it); named by the file's
+    SHA-256, so any change to the requirements misses.
+    """
+    return USER_CACHE_DIR / "venv-cache" / f"{_reqs_digest()[:16]}.zip"
+
+
+def _start_venv_cache_save() -> None:
+    """
+    Run _save_venv_cache in a detached, low-priority copy of the launcher,
+    so setup finishes (and the app can start) without waiting on the copy.
+    """
+    argv = [sys.executable, SAVE_CACHE_ARG]
+    if not _COMPILED:
+        argv.insert(1, str(Path(__file__).resolve()))
+    kwargs = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = (subprocess.DETACHED_PROCESS
+                                   | subprocess.CREATE_NEW_PROCESS_GROUP
+                                   | subprocess.BELOW_NORMAL_PRIORITY_CLASS)
+    else:
+        kwargs["start_new_session"] = True
+    try:
+        subprocess.Popen(argv, cwd=str(APP_DIR),
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, **kwargs)
+    except OSError:
+        pass    # no cache: the next reinstall just builds the venv again
+
+
+def _save_venv_cache(cache: Path) -> None:
+    """
+    Zip VENV_DIR to cache (best effort), replacing older archives.
+
+    Stored uncompressed — most of the bulk is native libraries that barely
+    compress, and extraction then runs at disk speed.  __pycache__ is left
+    out: extraction doesn't restore mtimes, so the bytecode would be stale.
+    Skipped when the venv is over VENV_CACHE_MAX_BYTES or the disk couldn't
+    hold the copy with as much to spare; discarded if a setup rewrote the
+    venv while it was being read.
+    """
+    import shutil
+    import zipfile
+    tmp = cache.with_suffix(".tmp")
+    try:
+        files = []
+        for root, dirs, names in os.walk(VENV_DIR):
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            files.extend(Path(root) / name for name in names)
+        size = sum(path.stat().st_size for path in files)
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        if size > VENV_CACHE_MAX_BYTES or shutil.disk_usage(cache.parent).free < 2 * size:
             return
+        with zipfile.ZipFile(tmp, "w", zipfile.ZIP_STORED) as zf:
+            for path in files:
+                zf.write(path, path.relative_to(VENV_DIR).as_posix())
+        if not REQS_STAMP.read_text(encoding="utf-8").startswith(cache.stem):
+            raise OSError("venv changed while it was being cached")
+        os.replace(tmp, cache)
+        for old in cache.parent.glob("*.zip"):
+            if old != cache:
+                old.unlink()
+    except Exception:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
 
-        # Step 1: create venv
-        window.set_status("Creating virtual environment...")
-        window.set_detail(str(VENV_DIR))
-        result = subprocess.run(
-            [python_cmd, "-m", "venv", str(VENV_DIR)],
-            capture_output=True, text=True,
-        )
+
+def _bundled_pip() -> Path | None:
+    """The pip wheel among the bundled wheels, if there is one."""
+    return next(iter(sorted(WHEELS_DIR.glob("pip-*.whl"))), None)
+
+
+def _venv_has_pip() -> bool:
+    """True if pip is installed in VENV_DIR."""
+    if sys.platform == "win32":
+        return (VENV_DIR / "Lib" / "site-packages" / "pip").is_dir()
+    return any(VENV_DIR.glob("lib/python*/site-packages/pip"))
+
+
+def _pip_install(window: "SetupWindow", source_args: list[str],
+                 reqs: Path = REQS, pip: "list[str] | None" = None) -> bool:
+    """
+    pip install reqs into the venv, echoing output to the window.  pip is
+    the command that runs pip (default: the venv's own, `python -m pip`).
+    """
+    pip_cmd = [
+        *(pip or [str(VENV_PYTHON), "-m", "pip"]), "install",
+        *source_args,
+        "-r", str(reqs),
+        # Skip byte-compiling every installed module (tens of thousands of
+        # files with torch) — Python compiles what the app actually imports
+        # on first use and caches it.  Wheels only when one exists, never
+        # a slow sdist build of a newer version.
+        "--no-compile",
+        "--prefer-binary",
+        # Don't also write every downloaded wheel (torch alone is hundreds
+        # of MB) into pip's cache — the finished venv is archived for
+        # reinstalls instead (see _save_venv_cache).
+        "--no-cache-dir",
+        "--no-warn-script-location",
+        "--disable-pip-version-check",
+    ]
+    # Unbuffered binary pipe: read() returns whatever pip has written so far,
+    # where text-mode line iteration can sit on a part-filled buffer for
+    # seconds.  Lines may end in \r (progress redraws) as well as \n, and
+    # only the last complete one per read is worth showing.
+    proc = subprocess.Popen(
+        pip_cmd,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        bufsize=0,
+    )
+    buf = b""
+    while chunk := proc.stdout.read(4096):
+        buf += chunk
+        end = max(buf.rfind(b"\n"), buf.rfind(b"\r"))
+        if end < 0:
+            continue
+        complete, buf = buf[:end], buf[end + 1:]
+        lines = complete.replace(b"\r", b"\n").split(b"\n")
+        line = next((ln.strip() for ln in reversed(lines) if ln.strip()), b"")
+        if line:
+            window.set_detail(line.decode("utf-8", errors="replace"))
+    proc.wait()
+    return proc.returncode == 0
+
+
+def _build_venv(window: "SetupWindow", python_cmd: "str | None") -> bool:
+    """
+    Create VENV_DIR (from VENV_TEMPLATE, else virtualenv.pyz, else
+    `python -m venv`) — unless it already exists — and pip install
+    requirements.txt into it.  Returns False, after showing the error, on
+    failure.
+    """
+    if not VENV_PYTHON.exists() and not _extract_venv_archive(VENV_TEMPLATE, python_cmd):
+        result = None
+        if VIRTUALENV_PYZ.exists():
+            # --app-data keeps virtualenv's extracted seed wheels between
+            # runs; --no-download uses the ones embedded in the zipapp.
+            result = subprocess.run(
+                [python_cmd, str(VIRTUALENV_PYZ),
+                 "--app-data", str(USER_CACHE_DIR / "virtualenv"),
+                 "--no-download", "--no-periodic-update",
+                 str(VENV_DIR)],
+                capture_output=True, text=True,
+            )
+        if result is None or result.returncode != 0:
+            # With a bundled pip wheel, skip ensurepip (most of the time
+            # `python -m venv` takes) and run pip straight from the wheel —
+            # it is importable as a zip.  The venv then has no pip of its
+            # own, which the app doesn't need.
+            pip_wheel = _bundled_pip()
+            result = subprocess.run(
+                [python_cmd, "-m", "venv", "--clear",
+                 *(["--without-pip"] if pip_wheel else []), str(VENV_DIR)],
+                capture_output=True, text=True,
+            )
         if result.returncode != 0:
             _show_error_and_close(
                 window,
@@ -221,39 +447,86 @@ def _run_setup(window: SetupWindow):
                 "Could not create the Python environment.\n\n"
                 f"Error:\n{result.stderr.strip() or result.stdout.strip()}"
             )
-            return
-
-        # Step 2: pip install
-        window.set_status("Installing dependencies (this may take a few minutes)...")
+            return False
+
+    # Step 2: pip install
+    # A venv made --without-pip (now or on an earlier run) has no pip of its
+    # own; run the bundled wheel's.
+    pip = None
+    pip_wheel = _bundled_pip()
+    if pip_wheel and not _venv_has_pip():
+        pip = [str(VENV_PYTHON), str(pip_wheel / "pip")]
+    window.set_status("Installing dependencies (this may take a few minutes)...")
+    if WHEELS_DIR.is_dir():
+        # Offline install from the bundled wheels — no DNS / TLS / index
+        # round trips.  They are built for the bundled Python 3.11, so a
+        # newer Python found on PATH may not match them — then fall back
+        # to PyPI, still preferring any bundled wheel that fits.
+        window.set_detail("Installing bundled packages...")
+        offline = ["--no-index", "--find-links", str(WHEELS_DIR)]
+        ok = False
+        if WHEELS_LOCK.exists():
+            # The lockfile is the complete dependency set, so pip skips its
+            # resolver and just verifies and unpacks each wheel.
+            ok = _pip_install(window, [*offline, "--no-deps", "--require-hashes"],
+                              reqs=WHEELS_LOCK, pip=pip)
+        if not ok:
+            ok = _pip_install(window, offline, pip=pip)
+        if not ok:
+            window.set_detail("Downloading packages from PyPI...")
+            ok = _pip_install(window, ["--find-links", str(WHEELS_DIR)], pip=pip)
+    else:
         window.set_detail("Downloading packages from PyPI...")
+        ok = _pip_install(window, [])
 
-        pip_cmd = [
-            str(VENV_PYTHON), "-m", "pip", "install",
-            "--upgrade", "-r", str(REQS),
-            "--no-warn-script-location",
-        ]
-        proc = subprocess.Popen(
-            pip_cmd,
-            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-            text=True, bufsize=1,
-            encoding="utf-8", errors="replace",
+    if not ok:
+        _show_error_and_close(
+            window,
+            "Setup Failed - Install Error",
+            "Failed to install dependencies.\n\n"
+            "Please check your internet connection and try launching again.\n"
+            "If the problem persists, contact support."
         )
-        for line in proc.stdout:
-            line = line.rstrip()
-            if line:
-                window.set_detail(line)
-        proc.wait()
+        return False
+    return True
 
-        if proc.returncode != 0:
+
+def _run_setup(window: "SetupWindow"):
+    """Run in a background thread: create venv + pip install."""
+    # Ensure all subprocesses run in UTF-8 mode
+    os.environ["PYTHONUTF8"] = "1"
+    try:
+        # A venv that already exists is only here because requirements.txt
+        # changed — install into it, no interpreter needed
+        updating = VENV_PYTHON.exists()
+        python_cmd = None if updating else _find_system_python()
+        if not updating and python_cmd is None:
             _show_error_and_close(
                 window,
-                "Setup Failed - Install Error",
-                "Failed to install dependencies.\n\n"
-                "Please check your internet connection and try launching again.\n"
-                "If the problem persists, contact support."
+                "Setup Failed - Python Not Found",
+                "LLC Scanner could not locate Python 3.11.\n\n"
+                "Please try uninstalling and reinstalling LLC Scanner.\n\n"
+                "If the problem persists, install Python 3.11 manually from:\n"
+                "https://www.python.org/downloads/\n"
+                "(Use the default options when installing.)"
             )
             return
 
+        # Step 1: create venv — straight from the cache of an earlier
+        # install with the same requirements.txt when there is one
+        window.set_status("Updating virtual environment..." if updating
+                          else "Creating virtual environment...")
+        window.set_detail(str(VENV_DIR))
+        cache = _cached_venv_path()
+        if updating or not _extract_venv_archive(cache, python_cmd):
+            if not _build_venv(window, python_cmd):
+                return
+            REQS_STAMP.write_text(_reqs_digest(), encoding="utf-8")
+
+            # Keep this environment for a later reinstall — in the
+            # background, it's a multi-GB copy
+            _start_venv_cache_save()
+
         window.set_status("Setup complete!")
         window.set_detail("Launch LLC Scanner from the Start Menu or desktop shortcut.")
 
@@ -281,26 +554,51 @@ def _launch_app():
 
     # Strip all PyInstaller-injected Tcl/Tk env vars from the child's environment.
     # When launcher.exe runs, PyInstaller sets TCL_LIBRARY / TK_LIBRARY / TCLLIBPATH
-    # pointing at its own _MEI* temp folder. The child pythonw.exe inherits these
+    # pointing at its own bundle folder. The child pythonw.exe inherits these
     # and tries to load Tcl from there instead of from C:\Python313, which causes:
     #   _tkinter.TclError: Can't find a usable init.tcl in the following directories:
     #       {C:\Users\...\Temp\_MEI348762\_tcl_data} ...
     # Removing them lets pythonw find its own Tcl installation normally.
-    for _var in ("TCL_LIBRARY", "TK_LIBRARY", "TCLLIBPATH",
-                 "TCL_DATA", "_MEIPASS2", "_PYI_ONEFILE_PARENT"):
+    for _var in ("TCL_LIBRARY", "TK_LIBRARY", "TCLLIBPATH", "TCL_DATA"):
         env.pop(_var, None)
 
+    # The bootloader's own private variables (_PYI_*, _MEIPASS2, ...) vary
+    # between PyInstaller versions, so drop them by prefix rather than by
+    # name, and set PyInstaller's official switch (6.10+) so any frozen
+    # program started further down the line also begins with a clean slate.
+    for _var in [k for k in env if k.upper().startswith(("_PYI_", "_MEIPASS"))]:
+        del env[_var]
+    env["PYINSTALLER_RESET_ENVIRONMENT"] = "1"
+
+    argv = [str(python_cmd), "-X", "utf8", str(MAIN_PY)]
+
+    if sys.platform != "win32":
+        # Replace the launcher with the app — no fork, no second process
+        # left waiting to exit.  (Windows has no real exec: os.execv there
+        # spawns a new process anyway, so it keeps the Popen below.)
+        os.chdir(APP_DIR)
+        os.execve(argv[0], argv, env)
+
+    # Fully detached on Windows: no console (even if only python.exe exists)
+    # and no standard handles to duplicate, so the launcher can exit at once
+    # without the app being tied to it.
     subprocess.Popen(
-        [str(python_cmd), "-X", "utf8", str(MAIN_PY)],
+        argv,
         cwd=str(APP_DIR),
         env=env,
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
     )
 
 
 # ── Entry point ────────────────────────────────────────────────────────────────
 
 def main():
-    if _needs_setup():
+    if SAVE_CACHE_ARG in sys.argv[1:]:
+        _save_venv_cache(_cached_venv_path())
+    elif _needs_setup():
+        # Only the setup path pays for loading Tcl/Tk
+        from setup_window import SetupWindow
         window = SetupWindow()
         thread = threading.Thread(target=_run_setup, args=(window,), daemon=True)
         thread.start()
@@ -2,13 +2,16 @@
 LLC Scanner — Launcher Diagnostics
 Run this directly with Python to see what the launcher sees on the installed machine.
 Writes a log to the desktop: LLC-Scanner-Debug.txt
+Set LLC_DIAG_NOGUI=1 to skip the closing dialog (unattended runs).
 """
 
 import os
 import sys
+import json
+import time
+import tempfile
 import subprocess
-import tkinter as tk
-from tkinter import messagebox
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 LOG_PATH = Path.home() / "Desktop" / "LLC-Scanner-Debug.txt"
@@ -39,8 +42,11 @@ log("")
 # Check what's in APP_DIR
 log("Files in APP_DIR:")
 try:
-    for f in sorted(APP_DIR.iterdir()):
-        log(f"  {f.name}{'/' if f.is_dir() else ''}")
+    # scandir entries carry the file type from the directory listing, so
+    # is_dir() needs no extra stat per file
+    with os.scandir(APP_DIR) as it:
+        for e in sorted(it, key=lambda e: e.name):
+            log(f"  {e.name}{'/' if e.is_dir() else ''}")
 except Exception as e:
     log(f"  ERROR listing: {e}")
 log("")
@@ -54,19 +60,24 @@ for minor in range(11, 16):
     p = Path(local_app) / "Programs" / "Python" / f"Python3{minor}" / "python.exe"
     log(f"  {p} -> {'EXISTS' if p.exists() else 'not found'}")
 
-for candidate in ("python", "python3", "py"):
+def probe_path_python(candidate):
     try:
         r = subprocess.run([candidate, "-c",
                             "import sys; v=sys.version_info; print(v.major,v.minor)"],
                            capture_output=True, text=True, timeout=5)
         if r.returncode == 0:
-            log(f"  PATH '{candidate}' -> version {r.stdout.strip()}")
-        else:
-            log(f"  PATH '{candidate}' -> failed (rc={r.returncode})")
+            return f"  PATH '{candidate}' -> version {r.stdout.strip()}"
+        return f"  PATH '{candidate}' -> failed (rc={r.returncode})"
     except FileNotFoundError:
-        log(f"  PATH '{candidate}' -> not found")
+        return f"  PATH '{candidate}' -> not found"
     except Exception as e:
-        log(f"  PATH '{candidate}' -> error: {e}")
+        return f"  PATH '{candidate}' -> error: {e}"
+
+# Each probe is an interpreter start-up, so run them side by side; map()
+# still yields the results in candidate order for the log.
+with ThreadPoolExecutor() as pool:
+    for line in pool.map(probe_path_python, ("python", "python3", "py")):
+        log(line)
 log("")
 
 # Check if .venv already exists (subsequent launch path)
@@ -76,54 +87,103 @@ if VENV_PYTHON.exists():
     log(f"  cwd: {APP_DIR}")
     log("")
 
+    # Start main.py now, so its 5 second window overlaps the import checks
+    # below instead of following them.  Output goes to temp files: nothing
+    # reads it until the end, and a full pipe would stall the app.
+    main_out = tempfile.TemporaryFile()
+    main_err = tempfile.TemporaryFile()
+    main_started = time.monotonic()
+    try:
+        main_proc = subprocess.Popen(
+            [str(VENV_PYTHON), str(MAIN_PY)],
+            stdout=main_out, stderr=main_err, cwd=str(APP_DIR)
+        )
+    except Exception as e:
+        main_proc = e
+
     # Try importing key modules via the venv python to find missing deps
     log("Checking key imports via venv python:")
-    for mod in ("tkinter", "PIL", "cv2", "imagehash", "numpy", "tcgdexsdk", "torch", "timm", "faiss"):
+    # One interpreter per group instead of one per module: it imports each
+    # module in turn and reports the outcomes as JSON.  A real import (not
+    # just find_spec) so DLL load failures still show up.  The light
+    # modules and the ML stack go in separate groups, run side by side.
+    script = (
+        "import importlib, json, sys\n"
+        "res = {}\n"
+        "for m in sys.argv[1:]:\n"
+        "    try:\n"
+        "        importlib.import_module(m)\n"
+        "        res[m] = None\n"
+        "    except BaseException as e:\n"
+        "        res[m] = f'{type(e).__name__}: {e}'\n"
+        "print(json.dumps(res))\n"
+    )
+
+    def check_imports(mods):
         try:
             r = subprocess.run(
-                [str(VENV_PYTHON), "-c", f"import {mod}; print('ok')"],
-                capture_output=True, text=True, timeout=15, cwd=str(APP_DIR)
+                [str(VENV_PYTHON), "-c", script, *mods],
+                capture_output=True, text=True, timeout=30, cwd=str(APP_DIR)
             )
             if r.returncode == 0:
-                log(f"  import {mod:15s} -> OK")
-            else:
-                err = (r.stderr or r.stdout).strip().splitlines()[-1] if (r.stderr or r.stdout).strip() else "unknown error"
-                log(f"  import {mod:15s} -> FAILED: {err}")
+                return json.loads(r.stdout.strip().splitlines()[-1])
+            # The interpreter itself died (e.g. a crashing extension module)
+            err = (r.stderr or r.stdout).strip().splitlines()[-1] if (r.stderr or r.stdout).strip() else "unknown error"
+            return {mod: err for mod in mods}
         except Exception as e:
-            log(f"  import {mod:15s} -> ERROR: {e}")
+            return {mod: f"ERROR: {e}" for mod in mods}
+
+    groups = (("tkinter", "PIL", "cv2", "imagehash", "numpy", "tcgdexsdk"),
+              ("torch", "timm", "faiss"))
+    with ThreadPoolExecutor() as pool:
+        for result in pool.map(check_imports, groups):
+            for mod, err in result.items():
+                if err is None:
+                    log(f"  import {mod:15s} -> OK")
+                else:
+                    log(f"  import {mod:15s} -> FAILED: {err}")
     log("")
 
     # Try running main.py and capture stdout/stderr
     log("Running main.py (5 second timeout):")
-    try:
-        r = subprocess.run(
-            [str(VENV_PYTHON), str(MAIN_PY)],
-            capture_output=True, text=True, timeout=5, cwd=str(APP_DIR)
-        )
-        log(f"  returncode: {r.returncode}")
-        if r.stdout.strip():
-            log("  stdout:")
-            for line in r.stdout.strip().splitlines():
-                log(f"    {line}")
-        if r.stderr.strip():
-            log("  stderr:")
-            for line in r.stderr.strip().splitlines():
-                log(f"    {line}")
-    except subprocess.TimeoutExpired:
-        log("  (process still running after 5s — this is normal if GUI launched successfully)")
-    except Exception as e:
-        log(f"  ERROR: {e}")
+    if isinstance(main_proc, Exception):
+        log(f"  ERROR: {main_proc}")
+    else:
+        try:
+            remaining = 5 - (time.monotonic() - main_started)
+            log(f"  returncode: {main_proc.wait(timeout=max(remaining, 0))}")
+        except subprocess.TimeoutExpired:
+            main_proc.kill()
+            main_proc.wait()
+            log("  (process still running after 5s — this is normal if GUI launched successfully)")
+        for label, fh in (("stdout", main_out), ("stderr", main_err)):
+            fh.seek(0)
+            text = fh.read().decode(errors="replace").strip()
+            if text:
+                log(f"  {label}:")
+                for line in text.splitlines():
+                    log(f"    {line}")
 else:
     log("VENV does not exist — first-run setup would run")
 
 # Write log
 LOG_PATH.write_text("\n".join(lines), encoding="utf-8")
 
-# Show summary in a dialog
-root = tk.Tk()
-root.withdraw()
-messagebox.showinfo(
-    "LLC Scanner Diagnostics",
-    f"Diagnostic log written to your Desktop:\n{LOG_PATH}\n\nOpen the file to see full results."
-)
-root.destroy()
+# Show summary in a dialog — unless running unattended (LLC_DIAG_NOGUI=1, or
+# no display), where tkinter isn't even imported and the path is printed
+if os.environ.get("LLC_DIAG_NOGUI"):
+    print(f"Diagnostic log written to: {LOG_PATH}")
+else:
+    import tkinter as tk
+    from tkinter import messagebox
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        print(f"Diagnostic log written to: {LOG_PATH}")
+    else:
+        root.withdraw()
+        messagebox.showinfo(
+            "LLC Scanner Diagnostics",
+            f"Diagnostic log written to your Desktop:\n{LOG_PATH}\n\nOpen the file to see full results."
+        )
+        root.destroy()
@@ -0,0 +1,117 @@
+"""
+LLC Scanner — first-run setup progress window.
+
+Kept apart from launcher.py so tkinter (and the Tcl/Tk DLLs behind it) is
+only loaded when setup actually runs: launcher.py imports this module
+lazily, and the steady-state launch never shows a window.  PyInstaller
+still bundles it — it follows imports inside functions too.
+"""
+
+import sys
+import tkinter as tk
+from tkinter import ttk
+from pathlib import Path
+
+
+class SetupWindow(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        self.title("LLC Scanner - First-Time Setup")
+        self.resizable(False, False)
+        self.configure(bg="#1a1a2e")
+
+        # ── Icons (favicon + logo image) ──────────────────────────────────────
+        # Assets are bundled into the PyInstaller _MEIPASS folder (_internal/);
+        # a Nuitka build puts them next to the compiled modules instead.
+        _assets = Path(getattr(sys, "_MEIPASS", Path(__file__).parent)) / "assets"
+
+        # Favicon / taskbar icon
+        try:
+            _ico = _assets / "logo.ico"
+            if _ico.exists():
+                self.iconbitmap(default=str(_ico))
+        except Exception:
+            pass
+
+        # Logo image displayed above the title text.
+        # Use tk.PhotoImage directly (supports PNG natively in Tk 8.6+)
+        # so we don't need Pillow bundled into the launcher exe.
+        self._logo_photo = None  # keep reference to prevent GC
+        try:
+            _png = _assets / "logo_white.png"
+            if _png.exists():
+                self._logo_photo = tk.PhotoImage(file=str(_png))
+                # Scale down to ~64px using Tk's subsample (image is likely 512px+)
+                w = self._logo_photo.width()
+                factor = max(1, w // 64)
+                self._logo_photo = self._logo_photo.subsample(factor, factor)
+        except Exception:
+            pass
+
+        # Centre on screen — do after icon so geometry is correct
+        self.update_idletasks()
+        w, h = 460, 220
+        x = (self.winfo_screenwidth()  - w) // 2
+        y = (self.winfo_screenheight() - h) // 2
+        self.geometry(f"{w}x{h}+{x}+{y}")
+
+        # Prevent closing during install
+        self.protocol("WM_DELETE_WINDOW", lambda: None)
+
+        # Logo image (if loaded)
+        if self._logo_photo:
+            tk.Label(self, image=self._logo_photo,
+                     bg="#1a1a2e").pack(pady=(18, 4))
+        else:
+            tk.Frame(self, height=18, bg="#1a1a2e").pack()  # spacing fallback
+
+        tk.Label(
+            self, text="LLC Scanner", bg="#1a1a2e", fg="#e0e0e0",
+            font=("Helvetica", 16, "bold"),
+        ).pack(pady=(0, 4))
+
+        self._status = tk.StringVar(value="Installing dependencies...")
+        tk.Label(
+            self, textvariable=self._status, bg="#1a1a2e", fg="#a0a0b0",
+            font=("Helvetica", 10),
+        ).pack(pady=(0, 12))
+
+        self._bar = ttk.Progressbar(self, mode="indeterminate", length=380)
+        self._bar.pack(pady=(0, 8))
+        # 20 Hz is smooth enough for an indeterminate bar and wakes Tk a
+        # quarter as often as the old 12 ms tick during a long install
+        self._bar.start(50)
+
+        self._detail = tk.StringVar(value="")
+        tk.Label(
+            self, textvariable=self._detail, bg="#1a1a2e", fg="#606080",
+            font=("Helvetica", 8),
+        ).pack()
+
+        # Latest detail line from the worker thread, picked up by a 100 ms
+        # poll — pip prints thousands of lines and one Tk callback per line
+        # floods the event queue.  Plain attribute writes/reads are atomic.
+        self._pending_detail = ""
+        self._shown_detail = ""
+        self.after(100, self._pump_detail)
+
+    def set_status(self, msg: str):
+        self.after(0, lambda: self._status.set(msg))
+
+    def set_detail(self, msg: str):
+        # Truncate long lines so the window doesn't resize
+        if len(msg) > 70:
+            msg = "..." + msg[-67:]
+        self._pending_detail = msg
+
+    def _pump_detail(self):
+        msg = self._pending_detail
+        if msg != self._shown_detail:
+            self._detail.set(msg)
+            self._shown_detail = msg
+        self.after(100, self._pump_detail)
+
+    def finish(self):
+        """Stop progress bar and allow close."""
+        self.after(0, self._bar.stop)
+        self.after(0, lambda: self.protocol("WM_DELETE_WINDOW", self.destroy))
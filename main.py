@@ -10,6 +10,7 @@ Usage:
 """
 
 import sys
+from functools import lru_cache
 
 
 def run_gui():
@@ -50,6 +51,23 @@ def run_embed():
     print("\nEmbedding complete.")
 
 
+@lru_cache(maxsize=None)
+def _hash_matcher():
+    """identifier.matcher.identify_card, imported on first use."""
+    from identifier.matcher import identify_card
+    return identify_card
+
+
+@lru_cache(maxsize=None)
+def _ml_matcher():
+    """
+    identifier.embedding_matcher.identify_card_embedding, imported on first
+    use — the import pulls in torch, timm and faiss, which takes seconds.
+    """
+    from identifier.embedding_matcher import identify_card_embedding
+    return identify_card_embedding
+
+
 def run_identify(image_path: str, matcher: str = "ml"):
     from db.database import init_db
     init_db()
@@ -57,34 +75,34 @@ def run_identify(image_path: str, matcher: str = "ml"):
     print(f"Identifying: {image_path}  [matcher={matcher}]\n")
 
     if matcher == "hash":
-        from identifier.matcher import identify_card
-        results = identify_card(image_path)
+        results = _hash_matcher()(image_path)
         score_key = "dist"
 
     elif matcher == "ml":
-        from identifier.embedding_matcher import identify_card_embedding
-        from identifier.matcher import identify_card
-        results = identify_card_embedding(image_path)
+        results = _ml_matcher()(image_path)
         score_key = "sim"
         if not results:
             print("No embeddings found, falling back to hash matcher.")
-            results = identify_card(image_path)
+            results = _hash_matcher()(image_path)
             score_key = "dist"
 
     else:  # hybrid
-        from identifier.embedding_matcher import identify_card_embedding
-        from identifier.matcher import identify_card
         from config import EMBEDDING_CONFIDENCE_MED
 
-        ml_results   = identify_card_embedding(image_path)
-        hash_results = identify_card(image_path)
-
-        if ml_results and ml_results[0]["distance"] >= EMBEDDING_CONFIDENCE_MED:
-            results = ml_results
-            score_key = "sim"
+        # Hash matcher first: it is cheap, and a high-confidence hash match
+        # is taken as is — the ML stack isn't even imported.
+        hash_results = _hash_matcher()(image_path)
+        if hash_results and hash_results[0]["confidence"] == "high":
+            results = hash_results
+            score_key = "dist"
         else:
-            results = hash_results if hash_results else ml_results
-            score_key = "dist" if results is hash_results else "sim"
+            ml_results = _ml_matcher()(image_path)
+            if ml_results and ml_results[0]["distance"] >= EMBEDDING_CONFIDENCE_MED:
+                results = ml_results
+                score_key = "sim"
+            else:
+                results = hash_results if hash_results else ml_results
+                score_key = "dist" if results is hash_results else "sim"
 
     if not results:
         print("No matches found.")
@@ -98,36 +116,34 @@ def run_identify(image_path: str, matcher: str = "ml"):
         )
 
 
+def _parse_args(argv: list[str]):
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Pokemon Card Identifier — launches the desktop GUI when run without arguments.",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--setup", action="store_true",
+                      help="download metadata + images + hashes + embeddings")
+    mode.add_argument("--embed", action="store_true",
+                      help="compute ML embeddings only (images already downloaded)")
+    mode.add_argument("--identify", metavar="PATH",
+                      help="identify the card in an image")
+    parser.add_argument("--matcher", choices=("hash", "ml", "hybrid"), default="ml",
+                        help="matcher for --identify (default: ml)")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    args = sys.argv[1:]
+    args = _parse_args(sys.argv[1:])
 
-    if "--setup" in args:
+    if args.setup:
         run_setup()
 
-    elif "--embed" in args:
+    elif args.embed:
         run_embed()
 
-    elif "--identify" in args:
-        idx = args.index("--identify")
-        try:
-            path = args[idx + 1]
-        except IndexError:
-            print("Usage: python main.py --identify <image_path> [--matcher hash|ml|hybrid]")
-            sys.exit(1)
-
-        matcher = "ml"  # default to ML matcher
-        if "--matcher" in args:
-            m_idx = args.index("--matcher")
-            try:
-                matcher = args[m_idx + 1]
-                if matcher not in ("hash", "ml", "hybrid"):
-                    print("--matcher must be one of: hash, ml, hybrid")
-                    sys.exit(1)
-            except IndexError:
-                print("--matcher requires a value: hash, ml, or hybrid")
-                sys.exit(1)
-
-        run_identify(path, matcher)
+    elif args.identify is not None:
+        run_identify(args.identify, args.matcher)
 
     else:
         try:
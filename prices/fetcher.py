@@ -3,13 +3,39 @@
 Fetches pricing from the TCGdex REST API (which aggregates TCGPlayer USD and
 CardMarket EUR data) and converts to CAD using the Frankfurter forex API.
 
-No API keys required. Forex rates and card pricing are cached per session.
+No API keys required. Forex rates and card pricing are cached in memory for
+the session and in prices.db (next to cards.db) across sessions (see the TTLs below).
 """
 
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from db import database as db
 
 TCGDEX_CARD_URL = "https://api.tcgdex.net/v2/en/cards/{}"
-FRANKFURTER_URL = "https://api.frankfurter.app/latest?from={}&to=CAD"
+# USD→CAD and USD→EUR in one response; EUR→CAD is derived from the two
+FRANKFURTER_URL = "https://api.frankfurter.app/latest?from=USD&to=CAD,EUR"
+
+# One pooled session for both APIs, so repeated lookups reuse the open
+# HTTPS connection instead of paying a TCP + TLS handshake every call.
+# Transient server errors / rate limiting are retried a couple of times.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504]),
+)
+_SESSION.mount("https://api.tcgdex.net", _ADAPTER)
+_SESSION.mount("https://api.frankfurter.app", _ADAPTER)
 
 # Finish label → preferred TCGdex tcgplayer variant key
 _FINISH_TO_TCGP: dict[str, str] = {
@@ -21,6 +47,7 @@ _FINISH_TO_TCGP: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=64)
 def _finish_label_to_tcgp(finish: str) -> str:
     """Map a finish label (possibly with subtype suffix) to a TCGPlayer variant key.
 
@@ -34,26 +61,119 @@ def _finish_label_to_tcgp(finish: str) -> str:
 # Ordered ascending by typical value so we err on the conservative side.
 _TCGP_FALLBACK_ORDER = ["normal", "reverseHolofoil", "holofoil"]
 
-# Module-level caches — populated once per session.
+# Variant keys to try for each preferred variant: it first, then the rest
+# of the fallback order — built once instead of per fetch_price call.
+_TCGP_TRY_ORDER: dict[str, list[str]] = {
+    wanted: [wanted] + [v for v in _TCGP_FALLBACK_ORDER if v != wanted]
+    for wanted in set(_FINISH_TO_TCGP.values()) | {"normal"}
+}
+
+# How long database-cached data stays fresh: the Frankfurter rates are
+# published once a day, TCGdex market prices refresh a few times a day.
+FOREX_TTL   = 24 * 3600
+PRICING_TTL = 6 * 3600
+# How long a failed pricing fetch (network down, unknown card id) is
+# remembered before the card is tried again — in memory only.
+FAILURE_TTL = 60
+
+# orjson.loads if orjson is installed, else json.loads; None = not looked up yet
+_loads = None
+
+
+def _get_loads():
+    """Return the JSON parser for API responses (orjson when available).
+
+    orjson is optional: it parses the nested pricing payload several times
+    faster than the stdlib and takes the raw response bytes, skipping the
+    decode to str.
+    """
+    global _loads
+    if _loads is None:
+        try:
+            import orjson
+            _loads = orjson.loads
+        except ImportError:
+            _loads = json.loads
+    return _loads
+
+
+# Largest API response accepted.  A TCGdex card is a few KB; anything near
+# this is a broken endpoint, not data worth buffering and parsing.
+MAX_RESPONSE_BYTES = 256 * 1024
+
+
+def _get_json(url: str, timeout: float):
+    """GET *url* and parse the JSON body, reading at most MAX_RESPONSE_BYTES.
+
+    Streams the body so an oversized response is cut off instead of being
+    buffered whole; raises ValueError for one (and requests errors as usual).
+    The cap counts decoded bytes — iter_content decompresses — so a small
+    gzipped body can't expand past it.
+    """
+    chunks, total = [], 0
+    with _SESSION.get(url, timeout=timeout, stream=True) as r:
+        r.raise_for_status()
+        for chunk in r.iter_content(chunk_size=16 * 1024):
+            total += len(chunk)
+            if total > MAX_RESPONSE_BYTES:
+                raise ValueError(
+                    f"response from {url} exceeds {MAX_RESPONSE_BYTES} bytes")
+            chunks.append(chunk)
+    return _get_loads()(b"".join(chunks))
+
+
+# Shared stand-in for a missing pricing section — only ever read
+_EMPTY: dict = {}
+
+# Module-level caches — populated once per session (from the database when
+# it has fresh data, otherwise from the network).
 _forex_cache:   dict[str, float] = {}   # currency -> CAD rate
 _pricing_cache: dict[str, dict]  = {}   # card_id  -> raw pricing dict
+_pricing_failures: dict[str, float] = {}  # card_id -> monotonic time of last failed fetch
 
 
-def _get_rate(currency: str) -> float | None:
-    """Return the CAD exchange rate for *currency* (e.g. 'USD', 'EUR').
+_forex_lock = threading.Lock()
+
 
-    Result is cached for the lifetime of the process. Returns None on error.
+def _load_rates() -> None:
+    """Fill _forex_cache with the USD and EUR → CAD rates.
+
+    Both come from the database when it has fresh values, otherwise from a
+    single Frankfurter request.  Leaves the cache untouched on error.
     """
-    if currency in _forex_cache:
-        return _forex_cache[currency]
     try:
-        r = requests.get(FRANKFURTER_URL.format(currency), timeout=5)
-        r.raise_for_status()
-        rate = r.json()["rates"]["CAD"]
-        _forex_cache[currency] = rate
-        return rate
+        rates = {c: db.get_cached_rate(c, FOREX_TTL) for c in ("USD", "EUR")}
+    except sqlite3.Error:
+        rates = {}
+    if rates and None not in rates.values():
+        _forex_cache.update(rates)
+        return
+    try:
+        usd = _get_json(FRANKFURTER_URL, timeout=5)["rates"]
+        rates = {"USD": usd["CAD"], "EUR": usd["CAD"] / usd["EUR"]}
     except Exception:
-        return None
+        return
+    _forex_cache.update(rates)
+    try:
+        for currency, rate in rates.items():
+            db.save_cached_rate(currency, rate)
+    except sqlite3.Error:
+        pass
+
+
+def _get_rate(currency: str) -> float | None:
+    """Return the CAD exchange rate for *currency* ('USD' or 'EUR').
+
+    Both rates are loaded together on first use and cached for the lifetime
+    of the process, and in the database for FOREX_TTL seconds.  Concurrent
+    callers wait for one load instead of each starting their own.  Returns
+    None on error (and tries again on the next call).
+    """
+    if currency not in _forex_cache:
+        with _forex_lock:
+            if currency not in _forex_cache:
+                _load_rates()
+    return _forex_cache.get(currency)
 
 
 def fetch_price(card_id: str, finish: str) -> tuple[float | None, str | None]:
@@ -67,7 +187,9 @@ def fetch_price(card_id: str, finish: str) -> tuple[float | None, str | None]:
     2. CardMarket EUR average price → converted to CAD.
 
     Pricing JSON is cached per card_id so repeated calls during a session
-    (e.g. when cycling candidates) do not hit the network again.
+    (e.g. when cycling candidates) do not hit the network again, and in the
+    database for PRICING_TTL seconds so a restart doesn't either.  A failed
+    fetch is not retried for FAILURE_TTL seconds.
 
     Returns:
         (price_cad, source_label)  if a price was found
@@ -84,21 +206,34 @@ def fetch_price(card_id: str, finish: str) -> tuple[float | None, str | None]:
     # Fetch and cache the pricing block for this card
     if card_id not in _pricing_cache:
         try:
-            r = requests.get(TCGDEX_CARD_URL.format(card_id), timeout=8)
-            r.raise_for_status()
-            _pricing_cache[card_id] = r.json().get("pricing") or {}
-        except Exception:
-            return None, None
+            pricing = db.get_cached_pricing(card_id, PRICING_TTL)
+        except sqlite3.Error:
+            pricing = None
+        if pricing is None:
+            failed_at = _pricing_failures.get(card_id)
+            if failed_at is not None and time.monotonic() - failed_at < FAILURE_TTL:
+                return None, None
+            try:
+                pricing = _get_json(TCGDEX_CARD_URL.format(card_id), timeout=8).get("pricing") or {}
+            except Exception:
+                _pricing_failures[card_id] = time.monotonic()
+                return None, None
+            _pricing_failures.pop(card_id, None)
+            try:
+                db.save_cached_pricing(card_id, pricing)
+            except sqlite3.Error:
+                pass
+        _pricing_cache[card_id] = pricing
     pricing = _pricing_cache[card_id]
 
     # ── TCGPlayer (USD) ───────────────────────────────────────────────────────
-    tcgp   = pricing.get("tcgplayer") or {}
+    tcgp   = pricing.get("tcgplayer") or _EMPTY
     wanted = _finish_label_to_tcgp(finish)
 
     # Try the preferred variant first, then fall back through the priority list
-    others = [v for v in _TCGP_FALLBACK_ORDER if v != wanted]
-    for variant_key in [wanted] + others:
-        variant_data = tcgp.get(variant_key) or {}
+    for variant_key in _TCGP_TRY_ORDER[wanted]:
+        if not (variant_data := tcgp.get(variant_key)):
+            continue
         usd_price = variant_data.get("marketPrice") or variant_data.get("midPrice")
         if usd_price:
             rate = _get_rate("USD")
@@ -106,9 +241,9 @@ def fetch_price(card_id: str, finish: str) -> tuple[float | None, str | None]:
                 return round(float(usd_price) * rate, 2), f"TCGPlayer {variant_key} (USD->CAD)"
 
     # ── CardMarket (EUR) fallback ─────────────────────────────────────────────
-    cm = pricing.get("cardmarket") or {}
-    _holo_base = finish.split("(")[0].strip()
-    if _holo_base in ("Holo", "Poke Ball Holo", "Master Ball Holo"):
+    cm = pricing.get("cardmarket") or _EMPTY
+    # Holo finishes are exactly the ones that map to the holofoil variant
+    if wanted == "holofoil":
         eur_price = cm.get("avg-holo") or cm.get("avg")
     else:
         eur_price = cm.get("avg")
@@ -119,3 +254,19 @@ def fetch_price(card_id: str, finish: str) -> tuple[float | None, str | None]:
             return round(float(eur_price) * rate, 2), "CardMarket (EUR->CAD)"
 
     return None, None
+
+
+def fetch_prices(pairs: list[tuple[str, str]]) -> list[tuple[float | None, str | None]]:
+    """Fetch prices for many cards at once — e.g. valuing a whole binder.
+
+    *pairs* is a list of ``(card_id, finish)``; the result has one
+    ``fetch_price`` return value per pair, in the same order.  Lookups run
+    on a thread pool (bounded by the session's connection pool) since each
+    is almost entirely waiting on the network.
+    """
+    if not pairs:
+        return []
+    # Load the forex rates up front so the workers don't all wait on it
+    _get_rate("USD")
+    with ThreadPoolExecutor(max_workers=min(16, len(pairs))) as pool:
+        return list(pool.map(lambda pair: fetch_price(*pair), pairs))
@@ -0,0 +1,50 @@
+"""Tests for identifier.preprocess."""
+
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+import identifier.preprocess as pp
+
+
+@pytest.fixture
+def quad_threads(monkeypatch):
+    """Record the thread name each fallback quad strategy runs on."""
+    seen: list[str] = []
+    for name in ("_quads_adaptive", "_quads_otsu"):
+        original = getattr(pp, name)
+
+        def recorder(*args, _original=original):
+            seen.append(threading.current_thread().name)
+            return _original(*args)
+
+        monkeypatch.setattr(pp, name, recorder)
+    return seen
+
+
+def _blank_scans(tmp_path, count: int) -> list[str]:
+    """Plain grey squares: Canny finds no confident quad in them."""
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"blank{i}.png"
+        cv2.imwrite(str(path), np.full((500, 500, 3), 40 + 20 * i, np.uint8))
+        paths.append(str(path))
+    return paths
+
+
+def test_preprocess_many_runs_quad_fallbacks_inline(tmp_path, quad_threads):
+    paths = _blank_scans(tmp_path, 6)
+    results = list(pp.preprocess_many(paths, pp.preprocess_for_hashing, workers=3))
+
+    assert [path for path, _ in results] == paths
+    assert len(quad_threads) == 2 * len(paths)
+    assert all(name.startswith("preprocess") for name in quad_threads)
+
+
+def test_single_image_uses_quad_pool(tmp_path, quad_threads):
+    pp.preprocess_for_hashing(_blank_scans(tmp_path, 1)[0])
+
+    assert len(quad_threads) == 2
+    assert all(name.startswith("quad") for name in quad_threads)